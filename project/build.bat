@@ -103,6 +103,15 @@ if errorlevel 1 (
   call :log "WARNING: onnxruntime/numpy install failed. VAD checkbox will be disabled."
 )
 
+REM ============================
+REM ENSURE orjson (optional, faster settings/session saves)
+REM ============================
+call :log "Ensuring orjson is installed..."
+"%PY%" -m pip install --user --upgrade orjson 1>>"%LOG%" 2>>&1
+if errorlevel 1 (
+  call :log "WARNING: orjson install failed (continuing, settings fall back to json)."
+)
+
 REM Download silero_vad.onnx if not already present
 if not exist "silero_vad.onnx" (
   call :log "Downloading silero_vad.onnx from GitHub..."
@@ -1,6 +1,8 @@
-import argparse, os, re, subprocess, sys, math, tempfile
+import argparse, functools, io, json, os, re, subprocess, sys, math, tempfile, threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import List, Tuple, Optional, Dict, Any
+from typing import List, Tuple, Optional, Dict, Any, Iterable, Iterator
 
 try:
     # Build a list of directories that contain onnxruntime's native DLLs.
@@ -57,12 +59,22 @@ except Exception as _e:
     _VAD_ERR = f"{type(_e).__name__}: {_e}"
 
 
-@dataclass
+@dataclass(slots=True)
 class SilenceInterval:
     start: float
     end: float
 
 
+def _no_window_kwargs() -> dict:
+    kwargs = {}
+    if os.name == "nt":
+        si = subprocess.STARTUPINFO()
+        si.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+        kwargs["startupinfo"] = si
+        kwargs["creationflags"] = subprocess.CREATE_NO_WINDOW
+    return kwargs
+
+
 def run(cmd: List[str], timeout_sec: int = 1800) -> subprocess.CompletedProcess:
     kwargs = dict(
         stdout=subprocess.PIPE,
@@ -71,23 +83,56 @@ def run(cmd: List[str], timeout_sec: int = 1800) -> subprocess.CompletedProcess:
         stdin=subprocess.DEVNULL,  # critical: ffmpeg can’t wait for input
         timeout=timeout_sec,  # critical: don’t hang forever
     )
-
-    if os.name == "nt":
-        si = subprocess.STARTUPINFO()
-        si.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-        kwargs["startupinfo"] = si
-        kwargs["creationflags"] = subprocess.CREATE_NO_WINDOW
+    kwargs.update(_no_window_kwargs())
 
     return subprocess.run(cmd, **kwargs)
 
 
+class _Deadline:
+    # Streamed ffmpeg output can't use run()'s timeout: this kills the process once it runs past
+    # timeout_sec, which also ends a read blocked on its pipe
+    def __init__(self, proc: subprocess.Popen, timeout_sec: int = 1800):
+        self.timeout_sec = timeout_sec
+        self.expired = False
+        self._proc = proc
+        self._timer = threading.Timer(timeout_sec, self._kill)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _kill(self):
+        self.expired = True
+        self._proc.kill()
+
+    def check(self, cmd: List[str]) -> None:
+        self._timer.cancel()
+        if self.expired:
+            raise subprocess.TimeoutExpired(cmd, self.timeout_sec)
+
+
+_TOOLS_OK = set()
+
+
 def require_tool(name: str) -> None:
+    # A tool that ran once is assumed to stay put; the GUI calls this for every Analyze/Generate
+    if name in _TOOLS_OK:
+        return
     p = run([name, "-version"])
     if p.returncode != 0:
         raise FileNotFoundError(f'Could not run "{name}". Make sure it is installed and on PATH.')
+    _TOOLS_OK.add(name)
 
 
-def get_duration_seconds(path: str) -> float:
+def _probe_key(path: str) -> Tuple[str, int, float]:
+    # ffprobe results are cached per file version: a changed size or mtime means a fresh probe.
+    try:
+        size, mtime = _source_signature(path)
+    except OSError:
+        size, mtime = -1, 0.0
+    return os.path.abspath(path), size, mtime
+
+
+@functools.lru_cache(maxsize=32)
+def _probe_duration(path: str, size: int, mtime: float) -> float:
     cmd = ["ffprobe", "-v", "error", "-show_entries", "format=duration", "-of", "default=noprint_wrappers=1:nokey=1",
            path]
     p = run(cmd)
@@ -96,38 +141,54 @@ def get_duration_seconds(path: str) -> float:
     return float(p.stdout.strip())
 
 
-def ffprobe_fields(path: str, select: str, entries: str) -> dict:
-    cmd = ["ffprobe", "-v", "error", "-select_streams", select, "-show_entries", entries, "-of",
-           "default=noprint_wrappers=1", path]
+def get_duration_seconds(path: str) -> float:
+    return _probe_duration(*_probe_key(path))
+
+
+_VIDEO_INFO_FIELDS = ("width", "height", "avg_frame_rate", "r_frame_rate", "sample_aspect_ratio", "field_order")
+_AUDIO_INFO_FIELDS = ("codec_name", "sample_rate", "channels", "channel_layout")
+
+
+@functools.lru_cache(maxsize=32)
+def _probe_media_info(path: str, size: int, mtime: float) -> dict:
+    # One ffprobe for both streams; the first video and first audio stream are picked from the JSON.
+    entries = "stream=codec_type," + ",".join(_VIDEO_INFO_FIELDS + _AUDIO_INFO_FIELDS)
+    cmd = ["ffprobe", "-v", "error", "-show_entries", entries, "-of", "json", path]
     p = run(cmd)
     if p.returncode != 0:
         return {}
-    out = {}
-    for line in p.stdout.splitlines():
-        if "=" in line:
-            k, v = line.split("=", 1)
-            out[k.strip()] = v.strip()
-    return out
+    try:
+        streams = json.loads(p.stdout or "{}").get("streams", [])
+    except ValueError:
+        return {}
 
+    video = next((st for st in streams if st.get("codec_type") == "video"), {})
+    audio = next((st for st in streams if st.get("codec_type") == "audio"), {})
 
-def get_media_info(path: str) -> dict:
-    v = ffprobe_fields(path, "v:0", "stream=width,height,avg_frame_rate,r_frame_rate,sample_aspect_ratio,field_order")
-    a = ffprobe_fields(path, "a:0", "stream=sample_rate,channels,channel_layout")
+    # Values stay strings, as ffprobe's flat output gave them
     info = {}
-    info.update(v)
-    info.update(a)
+    for k in _VIDEO_INFO_FIELDS:
+        if k in video:
+            info[k] = str(video[k])
+    for k in _AUDIO_INFO_FIELDS:
+        if k in audio:
+            info["audio_codec" if k == "codec_name" else k] = str(audio[k])
     return info
 
 
+def get_media_info(path: str) -> dict:
+    return dict(_probe_media_info(*_probe_key(path)))
+
+
+@functools.lru_cache(maxsize=16)
 def parse_rate(rate_str: str) -> float:
     if not rate_str or "/" not in rate_str:
         return 30.0
     n, d = rate_str.split("/", 1)
-    n = float(n)
-    d = float(d) if float(d) != 0 else 1.0
-    return n / d
+    return float(n) / (float(d) or 1.0)
 
 
+@functools.lru_cache(maxsize=16)
 def fps_to_timebase_ntsc_and_real_fps(fps: float) -> Tuple[int, bool, float]:
     if abs(fps - (30000 / 1001)) < 0.05 or abs(fps - 29.97) < 0.05:
         return 30, True, (30 / 1.001)
@@ -141,19 +202,66 @@ def sec_to_frames(sec: float, fps_real: float) -> int:
     return int(round(sec * fps_real))
 
 
-def create_mono_proxy(input_path: str, mono_path: str, sample_rate: int = 48000) -> None:
+def _source_signature(path: str) -> Tuple[int, float]:
+    st = os.stat(path)
+    return int(st.st_size), float(st.st_mtime)
+
+
+def _proxy_stamp_path(mono_path: str) -> str:
+    return mono_path + ".src.json"
+
+
+def mono_proxy_is_current(input_path: str, mono_path: str, audio_stream: Optional[str] = None) -> bool:
+    # The proxy is only reusable if it was made from the input as it is now (same size + mtime), from
+    # the same audio track.
+    try:
+        if os.path.getsize(mono_path) == 0:
+            return False
+        with open(_proxy_stamp_path(mono_path), "r", encoding="utf-8") as f:
+            stamp = json.load(f)
+        size, mtime = _source_signature(input_path)
+        return (int(stamp["size"]) == size and abs(float(stamp["mtime"]) - mtime) <= 0.5
+                and stamp.get("audio_stream") == (audio_stream or "0:a:0"))
+    except Exception:
+        return False
+
+
+def create_mono_proxy(input_path: str, mono_path: str, sample_rate: int = 48000,
+                      audio_stream: Optional[str] = None) -> None:
+    # Same track as the silence analysis, so the cuts line up with the audio the XML links to
+    amap = audio_stream or "0:a:0"
+    info = get_media_info(input_path)
+    # get_media_info describes the first audio stream, so it can only vouch for that one
+    already_mono = (
+            amap == "0:a:0"
+            and info.get("channels") == "1"
+            and info.get("audio_codec") == "pcm_s16le"
+            and info.get("sample_rate") == str(sample_rate)
+    )
+
     cmd = [
         "ffmpeg",
         "-hide_banner",
         "-nostdin",
         "-y",
         "-i", input_path,
-        "-c:v", "copy",
-        "-c:a", "pcm_s16le",
-        "-ac", "1",
-        "-ar", str(sample_rate),
-        mono_path,
+        # Without maps ffmpeg would pick the audio stream with the most channels, which in a
+        # multi-track file may not be the one analysed (or probed above)
+        "-map", "0:v:0?", "-map", amap,
     ]
+    if already_mono:
+        # Audio is already mono 16-bit PCM at the right rate: remux, don't re-encode
+        cmd += ["-c", "copy"]
+    else:
+        cmd += ["-c:v", "copy", "-c:a", "pcm_s16le", "-ac", "1", "-ar", str(sample_rate)]
+    cmd.append(mono_path)
+
+    # Drop the old stamp before ffmpeg starts overwriting the proxy: if this encode fails or is cut
+    # short, the half-written file must not pass mono_proxy_is_current next time
+    try:
+        os.remove(_proxy_stamp_path(mono_path))
+    except FileNotFoundError:
+        pass
 
     p = run(cmd)
 
@@ -168,16 +276,45 @@ def create_mono_proxy(input_path: str, mono_path: str, sample_rate: int = 48000)
             f"{p.stderr}"
         )
 
-
-def run_ffmpeg_silencedetect(path: str, threshold_db: float, min_silence: float, audio_stream: Optional[str]) -> str:
-    cmd = ["ffmpeg", "-hide_banner", "-i", path]
-    if audio_stream:
-        cmd += ["-map", audio_stream]
-    cmd += ["-vn", "-ac", "1", "-af", f"silencedetect=noise={threshold_db}dB:d={min_silence}", "-f", "null", "-"]
-    p = run(cmd)
-    if not p.stderr.strip():
+    size, mtime = _source_signature(input_path)
+    with open(_proxy_stamp_path(mono_path), "w", encoding="utf-8") as f:
+        json.dump({"size": size, "mtime": mtime, "audio_stream": amap}, f)
+
+
+def run_ffmpeg_silencedetect(path: str, threshold_db: float, min_silence: float,
+                             audio_stream: Optional[str]) -> List[SilenceInterval]:
+    # -vn/-sn/-dn on the input side keep ffmpeg from opening anything but audio; -nostats drops the
+    # progress lines while -loglevel info still lets the silencedetect lines through.
+    # The null muxer stays: an -af chain ending in anullsink has no output pad and ffmpeg rejects it.
+    cmd = ["ffmpeg", "-hide_banner", "-nostats", "-loglevel", "info", "-vn", "-sn", "-dn", "-i", path]
+    cmd += ["-map", audio_stream or "0:a:0?"]
+    # silencedetect only needs a level envelope, so analyse a 16 kHz downmix (content up to 8 kHz,
+    # which keeps sibilants above the threshold) instead of the full-rate source.
+    cmd += ["-ac", "1", "-ar", "16000", "-af", f"silencedetect=noise={threshold_db}dB:d={min_silence}",
+            "-f", "null", "-"]
+
+    # Parse stderr as ffmpeg writes it instead of buffering the whole log first.
+    got_output = False
+
+    def lines(proc):
+        nonlocal got_output
+        for line in proc.stderr:
+            got_output = True
+            yield line
+
+    kwargs = dict(stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, stdin=subprocess.DEVNULL, text=True,
+                  bufsize=1)
+    kwargs.update(_no_window_kwargs())
+    with subprocess.Popen(cmd, **kwargs) as proc:
+        deadline = _Deadline(proc)
+        intervals = list(iter_silences(lines(proc)))
+        proc.wait()
+        deadline.check(cmd)
+
+    if not got_output:
         raise RuntimeError("ffmpeg produced no silencedetect output; check ffmpeg install and input file.")
-    return p.stderr
+    intervals.sort(key=lambda x: x.start)
+    return intervals
 
 
 def _silero_model_path() -> str:
@@ -210,171 +347,168 @@ def run_vad_silencedetect(path: str, audio_stream: Optional[str],
     chunk_samples = 512          # 32 ms at 16 kHz — required chunk size for silero
     chunk_bytes = chunk_samples * 2  # s16le
 
-    tmp = tempfile.NamedTemporaryFile(suffix=".pcm", delete=False)
-    tmp_path = tmp.name
-    tmp.close()
+    # Decode straight from an ffmpeg pipe and feed the model as the audio arrives: memory stays at one
+    # read block (~8 s of audio) however long the recording, and nothing is written to a temp file.
+    cmd = ["ffmpeg", "-hide_banner", "-nostdin", "-nostats", "-loglevel", "error", "-vn", "-i", path]
+    cmd += ["-map", audio_stream or "0:a:0?"]
+    cmd += ["-ac", "1", "-ar", str(sample_rate), "-f", "s16le", "-"]
+    block_bytes = chunk_bytes * 256
+
+    # Silero VAD v4: separate h (2,1,64) and c (2,1,64) state tensors
+    h = _np.zeros((2, 1, 64), dtype=_np.float32)
+    c = _np.zeros((2, 1, 64), dtype=_np.float32)
+    sr_arr = _np.array(sample_rate, dtype=_np.int64)
+
+    THRESHOLD = 0.5  # speech probability cutoff
+    chunks_speech = bytearray()  # one speech/non-speech flag per chunk
+
+    # stderr goes to a file, not a pipe: nothing reads it until stdout is done, and a damaged input can
+    # log more errors than a pipe buffer holds, which would stall ffmpeg and this loop with it
+    err_file = tempfile.TemporaryFile()
+    kwargs = dict(stdout=subprocess.PIPE, stderr=err_file, stdin=subprocess.DEVNULL)
+    kwargs.update(_no_window_kwargs())
+    with err_file, subprocess.Popen(cmd, **kwargs) as proc:
+        deadline = _Deadline(proc)
+        carry = b""
+        while True:
+            block = proc.stdout.read(block_bytes)
+            if not block:
+                break
+            if carry:
+                block = carry + block
+            n = len(block) // chunk_bytes
+            # A trailing partial chunk waits for the next read (and is dropped at the end, as before)
+            carry = block[n * chunk_bytes:]
+            if not n:
+                continue
+            samples = _np.frombuffer(block, dtype=_np.int16, count=n * chunk_samples).astype(_np.float32)
+            samples *= 1.0 / 32768.0
+            samples = samples.reshape(n, 1, chunk_samples)  # (1, 512) per model call
+            for i in range(n):
+                out = session.run(None, {'input': samples[i], 'sr': sr_arr, 'h': h, 'c': c})
+                h, c = out[1], out[2]
+                chunks_speech.append(float(out[0].ravel()[0]) >= THRESHOLD)
+        proc.wait()
+        deadline.check(cmd)
+        err_file.seek(0)
+        err = err_file.read()
+    if proc.returncode != 0:
+        raise RuntimeError(f"ffmpeg failed to extract audio for VAD.\n{err.decode('utf-8', 'replace')}")
+
+    n_chunks = len(chunks_speech)
+
+    # Speech runs as [start, end) chunk indices, found in one pass over the flags instead of a Python
+    # loop per chunk: padding with zeros makes every run open with +1 and close with -1 in the diff.
+    flags = _np.zeros(n_chunks + 2, dtype=_np.int8)
+    flags[1:-1] = _np.frombuffer(chunks_speech, dtype=_np.uint8)
+    edges = _np.diff(flags)
+    run_starts = _np.flatnonzero(edges == 1)
+    run_ends = _np.flatnonzero(edges == -1)
+
+    # Smooth: collapse short speech bursts (< 150 ms) back to non-speech so
+    # brief transients (keyboard clicks, mouth pops) don't break up silences.
+    frame_ms = chunk_samples * 1000 // sample_rate   # 32 ms per chunk
+    min_speech_frames = max(1, 150 // frame_ms)       # ~4-5 chunks
+    long_runs = (run_ends - run_starts) >= min_speech_frames
+    speech_starts = run_starts[long_runs].tolist()
+    speech_ends = run_ends[long_runs].tolist()
+
+    # Silences are the gaps around the remaining speech runs; one still open at the end runs to inf
+    intervals: List[SilenceInterval] = []
+    for a, b in zip([0] + speech_ends, speech_starts + [n_chunks]):
+        if b > a:
+            t0 = a * chunk_samples / sample_rate
+            t1 = b * chunk_samples / sample_rate if b < n_chunks else math.inf
+            intervals.append(SilenceInterval(t0, t1))
+
+    return intervals
 
-    try:
-        cmd = ["ffmpeg", "-hide_banner", "-nostdin", "-y", "-i", path]
-        if audio_stream:
-            cmd += ["-map", audio_stream]
-        cmd += ["-vn", "-ac", "1", "-ar", str(sample_rate), "-f", "s16le", tmp_path]
-        p = run(cmd)
-        if p.returncode != 0:
-            raise RuntimeError(f"ffmpeg failed to extract audio for VAD.\n{p.stderr}")
-
-        with open(tmp_path, "rb") as f:
-            raw = f.read()
-
-        n_chunks = len(raw) // chunk_bytes
-
-        # Silero VAD v4: separate h (2,1,64) and c (2,1,64) state tensors
-        h = _np.zeros((2, 1, 64), dtype=_np.float32)
-        c = _np.zeros((2, 1, 64), dtype=_np.float32)
-        sr_arr = _np.array(sample_rate, dtype=_np.int64)
-
-        THRESHOLD = 0.5  # speech probability cutoff
-        chunks_speech: List[bool] = []
-
-        for i in range(n_chunks):
-            chunk_raw = raw[i * chunk_bytes:(i + 1) * chunk_bytes]
-            samples = (_np.frombuffer(chunk_raw, dtype=_np.int16)
-                       .astype(_np.float32) / 32768.0)[_np.newaxis, :]  # (1, 512)
-            out = session.run(None, {'input': samples, 'sr': sr_arr, 'h': h, 'c': c})
-            h, c = out[1], out[2]
-            chunks_speech.append(float(out[0].ravel()[0]) >= THRESHOLD)
-
-        # Smooth: collapse short speech bursts (< 150 ms) back to non-speech so
-        # brief transients (keyboard clicks, mouth pops) don't break up silences.
-        frame_ms = chunk_samples * 1000 // sample_rate   # 32 ms per chunk
-        min_speech_frames = max(1, 150 // frame_ms)       # ~4-5 chunks
-        i = 0
-        while i < n_chunks:
-            if chunks_speech[i]:
-                j = i + 1
-                while j < n_chunks and chunks_speech[j]:
-                    j += 1
-                if (j - i) < min_speech_frames:
-                    for k in range(i, j):
-                        chunks_speech[k] = False
-                i = j
-            else:
-                i += 1
-
-        # Build silence intervals from smoothed decisions
-        intervals: List[SilenceInterval] = []
-        silence_start: Optional[float] = None
-
-        for i, is_speech in enumerate(chunks_speech):
-            t = i * chunk_samples / sample_rate
-            if not is_speech:
-                if silence_start is None:
-                    silence_start = t
-            else:
-                if silence_start is not None:
-                    intervals.append(SilenceInterval(silence_start, t))
-                    silence_start = None
-
-        if silence_start is not None:
-            intervals.append(SilenceInterval(silence_start, math.inf))
-
-        return intervals
-
-    finally:
-        try:
-            os.unlink(tmp_path)
-        except Exception:
-            pass
 
+_SILENCE_RE = re.compile(r"silence_(start|end):\s*([0-9]*\.?[0-9]+)")
 
-def parse_silences(ffmpeg_stderr: str) -> List[SilenceInterval]:
-    starts = []
-    intervals: List[SilenceInterval] = []
-    start_re = re.compile(r"silence_start:\s*([0-9]*\.?[0-9]+)")
-    end_re = re.compile(r"silence_end:\s*([0-9]*\.?[0-9]+)")
 
-    for line in ffmpeg_stderr.splitlines():
-        m1 = start_re.search(line)
-        if m1:
-            starts.append(float(m1.group(1)))
-            continue
-        m2 = end_re.search(line)
-        if m2 and starts:
-            s = starts.pop(0)
-            e = float(m2.group(1))
-            if e > s:
-                intervals.append(SilenceInterval(s, e))
+def _pair_silences(marks: Iterable[Tuple[str, str]]) -> Iterator[SilenceInterval]:
+    starts = deque()
+    for kind, val in marks:
+        t = float(val)
+        if kind == "start":
+            starts.append(t)
+        elif starts:
+            s = starts.popleft()
+            if t > s:
+                yield SilenceInterval(s, t)
 
+    # A silence still open when the log ends runs to the end of the media
     for s in starts:
-        intervals.append(SilenceInterval(s, math.inf))
+        yield SilenceInterval(s, math.inf)
 
+
+def iter_silences(lines: Iterable[str]) -> Iterator[SilenceInterval]:
+    return _pair_silences(m for line in lines for m in _SILENCE_RE.findall(line))
+
+
+def parse_silences(ffmpeg_stderr: str) -> List[SilenceInterval]:
+    # One regex scan over the whole log; no per-line split needed.
+    intervals = list(_pair_silences(_SILENCE_RE.findall(ffmpeg_stderr)))
     intervals.sort(key=lambda x: x.start)
     return intervals
 
 
 def merge_overlaps(intervals: List[SilenceInterval], duration: float) -> List[SilenceInterval]:
-    fixed = []
+    # Clamp and sort plain (start, end) tuples, then sweep once keeping a running max end;
+    # objects are only built for the merged output.
+    spans = []
     for iv in intervals:
         s = max(0.0, iv.start)
         e = duration if math.isinf(iv.end) else min(duration, iv.end)
         if e > s:
-            fixed.append(SilenceInterval(s, e))
-    fixed.sort(key=lambda x: x.start)
+            spans.append((s, e))
+    if not spans:
+        return []
+    spans.sort()
 
     merged: List[SilenceInterval] = []
-    for iv in fixed:
-        if not merged:
-            merged.append(iv)
-            continue
-        last = merged[-1]
-        if iv.start <= last.end:
-            last.end = max(last.end, iv.end)
+    cur_s, cur_e = spans[0]
+    for s, e in spans:
+        if s <= cur_e:
+            if e > cur_e:
+                cur_e = e
         else:
-            merged.append(iv)
+            merged.append(SilenceInterval(cur_s, cur_e))
+            cur_s, cur_e = s, e
+    merged.append(SilenceInterval(cur_s, cur_e))
     return merged
 
 
 def invert_to_keeps(silences: List[SilenceInterval], duration: float, pad: float, min_keep: float) -> List[
     Tuple[float, float]]:
-    # 1) Merge silences WITHOUT padding
-    removes = merge_overlaps(silences, duration)
-
-    # 2) Invert to keeps
+    # `silences` must already be merged and sorted (see merge_overlaps). Each gap between them is a keep;
+    # keeps shorter than min_keep are dropped, the rest are padded outward and folded into the previous
+    # keep when the padding makes them overlap - all in the same pass.
+    pad = max(0.0, pad)
     keeps: List[Tuple[float, float]] = []
+
+    def add_keep(ks: float, ke: float):
+        if (ke - ks) < min_keep:
+            return
+        a = max(0.0, ks - pad)
+        b = min(duration, ke + pad)
+        if b <= a:
+            return
+        if keeps and a <= keeps[-1][1]:
+            if b > keeps[-1][1]:
+                keeps[-1] = (keeps[-1][0], b)
+        else:
+            keeps.append((a, b))
+
     cursor = 0.0
-    for iv in removes:
+    for iv in silences:
         if iv.start > cursor:
-            ks, ke = cursor, iv.start
-            if (ke - ks) >= min_keep:
-                keeps.append((ks, ke))
+            add_keep(cursor, iv.start)
         cursor = max(cursor, iv.end)
 
-    if duration > cursor and (duration - cursor) >= min_keep:
-        keeps.append((cursor, duration))
-
-    # 3) Pad the KEEPS outward (what you want)
-    if pad > 0.0 and keeps:
-        padded = []
-        for a, b in keeps:
-            a2 = max(0.0, a - pad)
-            b2 = min(duration, b + pad)
-            if b2 > a2:
-                padded.append((a2, b2))
-
-        # Merge overlaps caused by padding
-        padded.sort(key=lambda x: x[0])
-        merged: List[Tuple[float, float]] = []
-        for a, b in padded:
-            if not merged:
-                merged.append((a, b))
-                continue
-            la, lb = merged[-1]
-            if a <= lb:
-                merged[-1] = (la, max(lb, b))
-            else:
-                merged.append((a, b))
-
-        keeps = merged
+    if duration > cursor:
+        add_keep(cursor, duration)
 
     return keeps
 
@@ -416,7 +550,10 @@ def field_order_to_fcp(field: str) -> str:
     return "none"
 
 
-def make_fcp7_xml(link_media_path: str, keeps: List[Tuple[float, float]], seq_name: str) -> str:
+_TO_URL_SEPARATORS = str.maketrans({"\\": "/"})
+
+
+def make_fcp7_xml(link_media_path: str, keeps: List[Tuple[float, float]], seq_name: str) -> bytes:
     dur = get_duration_seconds(link_media_path)
     info = get_media_info(link_media_path)
 
@@ -431,35 +568,23 @@ def make_fcp7_xml(link_media_path: str, keeps: List[Tuple[float, float]], seq_na
     par_n, par_d = sar_to_par(sar)
     field = field_order_to_fcp(info.get("field_order", "progressive"))
 
-    abs_path = os.path.abspath(link_media_path).replace("\\", "/")
+    abs_path = os.path.abspath(link_media_path).translate(_TO_URL_SEPARATORS)
     pathurl = "file:///" + abs_path
+    basename = os.path.basename(link_media_path)
+    ntsc_str = "TRUE" if ntsc else "FALSE"
+    dur_frames = sec_to_frames(dur, fps_real)
 
-    v_track_items = []
-    a_track_items = []
-
-    timeline_cursor = 0.0
-    for i, (ks, ke) in enumerate(keeps, start=1):
-        seg_dur = max(0.0, ke - ks)
-        if seg_dur <= 0:
-            continue
-
-        v_id = f"clipitem-v{i}"
-        a_id = f"clipitem-a{i}"
-
-        start_f = sec_to_frames(timeline_cursor, fps_real)
-        end_f = sec_to_frames(timeline_cursor + seg_dur, fps_real)
-        in_f = sec_to_frames(ks, fps_real)
-        out_f = sec_to_frames(ke, fps_real)
-
-        file_block = f"""
+    # The full <file> definition is written once, inside the first video clipitem;
+    # every other clipitem (video and audio) refers back to it by id.
+    file_block = f"""
             <file id="file-1">
-              <name>{os.path.basename(link_media_path)}</name>
+              <name>{basename}</name>
               <pathurl>{pathurl}</pathurl>
               <rate>
                 <timebase>{timebase}</timebase>
-                <ntsc>{"TRUE" if ntsc else "FALSE"}</ntsc>
+                <ntsc>{ntsc_str}</ntsc>
               </rate>
-              <duration>{sec_to_frames(dur, fps_real)}</duration>
+              <duration>{dur_frames}</duration>
               <media>
                 <video>
                   <samplecharacteristics>
@@ -477,18 +602,74 @@ def make_fcp7_xml(link_media_path: str, keeps: List[Tuple[float, float]], seq_na
                   </samplecharacteristics>
                 </audio>
               </media>
-            </file>
-        """.strip()
+            </file>""".strip()
+    file_ref = '<file id="file-1"/>'
 
-        v_item = f"""
+    # Everything per clip is resolved once here; both track loops below only fill templates.
+    # Clips are laid back to back, so each clip's timeline start is the previous clip's end frame.
+    clips = []
+    timeline_cursor = 0.0
+    start_f = sec_to_frames(timeline_cursor, fps_real)
+    for i, (ks, ke) in enumerate(keeps, start=1):
+        seg_dur = max(0.0, ke - ks)
+        if seg_dur <= 0:
+            continue
+        timeline_cursor += seg_dur
+        end_f = sec_to_frames(timeline_cursor, fps_real)
+        clips.append((
+            i,
+            f"clipitem-v{i}",
+            f"clipitem-a{i}",
+            f"{seq_name}_{i:03d}",
+            start_f,
+            end_f,
+            sec_to_frames(ks, fps_real),
+            sec_to_frames(ke, fps_real),
+        ))
+        start_f = end_f
+
+    # Fragments are encoded as they are written, so the finished document is already UTF-8 bytes.
+    out = io.BytesIO()
+
+    def w(text: str):
+        out.write(text.encode("utf-8"))
+
+    w(f"""<?xml version="1.0" encoding="UTF-8"?>
+<!DOCTYPE xmeml>
+<xmeml version="4">
+  <sequence>
+    <name>{seq_name}</name>
+    <rate>
+      <timebase>{timebase}</timebase>
+      <ntsc>{ntsc_str}</ntsc>
+    </rate>
+    <media>
+      <video>
+        <format>
+          <samplecharacteristics>
+            <rate>
+              <timebase>{timebase}</timebase>
+              <ntsc>{ntsc_str}</ntsc>
+            </rate>
+            <width>{width}</width>
+            <height>{height}</height>
+            <anamorphic>FALSE</anamorphic>
+            <pixelaspectratio>{par_n}/{par_d}</pixelaspectratio>
+            <fielddominance>{field}</fielddominance>
+          </samplecharacteristics>
+        </format>
+        <track>""")
+
+    for n, (i, v_id, a_id, name, start_f, end_f, in_f, out_f) in enumerate(clips):
+        w(f"""
           <clipitem id="{v_id}">
-            <name>{seq_name}_{i:03d}</name>
+            <name>{name}</name>
             <enabled>TRUE</enabled>
             <start>{start_f}</start>
             <end>{end_f}</end>
             <in>{in_f}</in>
             <out>{out_f}</out>
-            {file_block}
+            {file_block if n == 0 else file_ref}
             <link>
               <linkclipref>{v_id}</linkclipref>
               <mediatype>video</mediatype>
@@ -501,18 +682,37 @@ def make_fcp7_xml(link_media_path: str, keeps: List[Tuple[float, float]], seq_na
               <trackindex>1</trackindex>
               <clipindex>{i}</clipindex>
             </link>
-          </clipitem>
-        """
+          </clipitem>""")
 
-        a_item = f"""
+    if not clips:
+        w("""
+          <gap>
+            <name>Empty</name>
+            <duration>1</duration>
+          </gap>""")
+
+    w(f"""
+        </track>
+      </video>
+      <audio>
+        <format>
+          <samplecharacteristics>
+            <samplerate>{sample_rate}</samplerate>
+            <channels>{channels}</channels>
+          </samplecharacteristics>
+        </format>
+        <track>""")
+
+    for i, v_id, a_id, name, start_f, end_f, in_f, out_f in clips:
+        w(f"""
           <clipitem id="{a_id}">
-            <name>{seq_name}_{i:03d}</name>
+            <name>{name}</name>
             <enabled>TRUE</enabled>
             <start>{start_f}</start>
             <end>{end_f}</end>
             <in>{in_f}</in>
             <out>{out_f}</out>
-            <file id="file-1"/>
+            {file_ref}
             <sourcetrack>
               <mediatype>audio</mediatype>
               <trackindex>1</trackindex>
@@ -529,65 +729,16 @@ def make_fcp7_xml(link_media_path: str, keeps: List[Tuple[float, float]], seq_na
               <trackindex>1</trackindex>
               <clipindex>{i}</clipindex>
             </link>
-          </clipitem>
-        """
-
-        v_track_items.append(v_item)
-        a_track_items.append(a_item)
-        timeline_cursor += seg_dur
-
-    if not v_track_items:
-        v_track_items.append("""
-          <gap>
-            <name>Empty</name>
-            <duration>1</duration>
-          </gap>
-        """)
+          </clipitem>""")
 
-    xml = f"""<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE xmeml>
-<xmeml version="4">
-  <sequence>
-    <name>{seq_name}</name>
-    <rate>
-      <timebase>{timebase}</timebase>
-      <ntsc>{"TRUE" if ntsc else "FALSE"}</ntsc>
-    </rate>
-    <media>
-      <video>
-        <format>
-          <samplecharacteristics>
-            <rate>
-              <timebase>{timebase}</timebase>
-              <ntsc>{"TRUE" if ntsc else "FALSE"}</ntsc>
-            </rate>
-            <width>{width}</width>
-            <height>{height}</height>
-            <anamorphic>FALSE</anamorphic>
-            <pixelaspectratio>{par_n}/{par_d}</pixelaspectratio>
-            <fielddominance>{field}</fielddominance>
-          </samplecharacteristics>
-        </format>
-        <track>
-          {''.join(v_track_items)}
-        </track>
-      </video>
-      <audio>
-        <format>
-          <samplecharacteristics>
-            <samplerate>{sample_rate}</samplerate>
-            <channels>{channels}</channels>
-          </samplecharacteristics>
-        </format>
-        <track>
-          {''.join(a_track_items)}
+    w("""
         </track>
       </audio>
     </media>
   </sequence>
 </xmeml>
-"""
-    return xml
+""")
+    return out.getvalue()
 
 
 def compute_plan(input_path: str, threshold: float, min_silence: float, pad: float, min_keep: float,
@@ -603,8 +754,7 @@ def compute_plan(input_path: str, threshold: float, min_silence: float, pad: flo
     if use_vad:
         silences_raw = run_vad_silencedetect(input_path, audio_stream, vad_aggressiveness)
     else:
-        stderr = run_ffmpeg_silencedetect(input_path, threshold, min_silence, audio_stream)
-        silences_raw = parse_silences(stderr)
+        silences_raw = run_ffmpeg_silencedetect(input_path, threshold, min_silence, audio_stream)
     silences = merge_overlaps(silences_raw, orig_duration)
     keeps = invert_to_keeps(silences, orig_duration, pad, min_keep)
     removes = keeps_to_removes(keeps, orig_duration)
@@ -647,14 +797,21 @@ def main(argv=None):
     base = os.path.splitext(os.path.basename(args.input))[0]
     mono_path = os.path.join(in_dir, f"__SILENCECUT_MONO_PROXY__{base}.mov")
 
-    if args.regen_mono or not os.path.isfile(mono_path) or os.path.getsize(mono_path) == 0:
+    need_proxy = args.regen_mono or not mono_proxy_is_current(args.input, mono_path, args.audio_stream)
+    if need_proxy:
         print("Creating mono proxy:", mono_path)
-        create_mono_proxy(args.input, mono_path, sample_rate=48000)
     else:
         print("Using existing mono proxy:", mono_path)
 
-    plan = compute_plan(args.input, args.threshold, args.min_silence, args.pad, args.min_keep, args.audio_stream,
-                        use_vad=args.use_vad, vad_aggressiveness=args.vad_aggressiveness)
+    # The proxy encode and the silence analysis only read the input, so run them side by side.
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        proxy_fut = pool.submit(create_mono_proxy, args.input, mono_path, 48000,
+                                args.audio_stream) if need_proxy else None
+        plan_fut = pool.submit(compute_plan, args.input, args.threshold, args.min_silence, args.pad, args.min_keep,
+                               args.audio_stream, use_vad=args.use_vad, vad_aggressiveness=args.vad_aggressiveness)
+        plan = plan_fut.result()
+        if proxy_fut is not None:
+            proxy_fut.result()
     keeps = plan["keeps"]
 
     print(f"Detected silences: {plan['silences_count']} | Kept segments: {plan['keeps_count']}")
@@ -663,7 +820,7 @@ def main(argv=None):
     out_xml = os.path.join(in_dir, f"{base}__nosilence.XML")
 
     xml = make_fcp7_xml(mono_path, keeps, seq_name)
-    with open(out_xml, "w", encoding="utf-8", newline="\n") as f:
+    with open(out_xml, "wb") as f:
         f.write(xml)
 
     print("Wrote:", out_xml)
@@ -1,16 +1,31 @@
+import bisect
 import contextlib
 import datetime
+import functools
 import importlib.util
-import io
 import json
+import math
+import multiprocessing
 import os
-import platform
 import queue
+import stat
 import sys
 import threading
+from array import array
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+try:
+    # Already shipped for the VAD path; the timeline uses it to map long plans to pixels in one go
+    import numpy as _np
+except ImportError:
+    _np = None
+
 SCRIPT_NAME = "cut_silence_to_fcpxml.py"
 
 DEFAULTS = {
@@ -29,6 +44,15 @@ DEFAULT_ZOOM_PX_PER_SEC = 20.0
 MIN_ZOOM_PX_PER_SEC = 4.0
 MAX_ZOOM_PX_PER_SEC = 220.0
 
+TIMELINE_H = 66
+TIMELINE_BAR_Y0 = 10
+TIMELINE_BAR_Y1 = TIMELINE_H - 10
+OVERVIEW_BAR_PAD = 6
+
+LOG_MAX_LINES = 5000
+LOG_TRIM_LINES = 1000
+LOG_SAFETY_DRAIN_MS = 500
+
 
 def _install_crash_log():
     def excepthook(exc_type, exc, tb):
@@ -47,6 +71,8 @@ def _install_crash_log():
 _install_crash_log()
 
 
+# Probes the disk and prepends to PATH; once per process is enough
+@functools.lru_cache(maxsize=1)
 def _add_vlc_dll_dir():
     paths = []
 
@@ -57,7 +83,7 @@ def _add_vlc_dll_dir():
     pf = os.environ.get("ProgramFiles", r"C:\Program Files")
     pfx86 = os.environ.get("ProgramFiles(x86)", r"C:\Program Files (x86)")
 
-    is_64 = platform.architecture()[0] == "64bit"
+    is_64 = sys.maxsize > 2**32
     pf_vlc = os.path.join(pf, "VideoLAN", "VLC")
     pfx86_vlc = os.path.join(pfx86, "VideoLAN", "VLC")
 
@@ -86,12 +112,17 @@ def _add_vlc_dll_dir():
     return None
 
 
+_RESOURCE_DIR = getattr(sys, "_MEIPASS", os.path.dirname(os.path.abspath(__file__)))
+_SCRIPT_FULL_PATH = os.path.join(_RESOURCE_DIR, SCRIPT_NAME)
+
+
 def _resource_dir():
-    return getattr(sys, "_MEIPASS", os.path.dirname(os.path.abspath(__file__)))
+    return _RESOURCE_DIR
 
 
 def _script_path():
-    return os.path.join(_resource_dir(), SCRIPT_NAME)
+    # Resolved once at import; neither location can change while the app runs
+    return _SCRIPT_FULL_PATH
 
 
 def _load_module_from_path(module_name: str, path: str):
@@ -99,19 +130,61 @@ def _load_module_from_path(module_name: str, path: str):
     if spec is None or spec.loader is None:
         raise RuntimeError(f"Failed to load spec for: {path}")
     mod = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(mod)
+    # Registered like a normal import, so pickling and anything looking the module up by name finds it
+    sys.modules[module_name] = mod
+    try:
+        spec.loader.exec_module(mod)
+    except BaseException:
+        sys.modules.pop(module_name, None)
+        raise
     return mod
 
 
+_POOL_CUTTER = None
+_POOL_CUTTER_MTIME = None
+
+# One libvlc instance per process, shared by every player that gets created
+_VLC_INSTANCE = None
+
+
+def _plan_child_main(conn):
+    # Analysis process: serves (script_path, inp, params) requests until the GUI closes the pipe, and
+    # answers each with (True, plan) or (False, exception)
+    while True:
+        try:
+            req = conn.recv()
+        except EOFError:
+            return
+        try:
+            reply = (True, _compute_plan_in_child(*req))
+        except Exception as e:
+            reply = (False, e)
+        try:
+            conn.send(reply)
+        except Exception as e:
+            # The plan or exception didn't pickle; the message still gets through
+            conn.send((False, RuntimeError(str(reply[1]) if not reply[0] else str(e))))
+
+
+def _compute_plan_in_child(script_path: str, inp: str, params: dict):
+    # Runs in the analysis process; like App._load_cutter, the cutter is loaded once per version of the
+    # script and reused until the file changes
+    global _POOL_CUTTER, _POOL_CUTTER_MTIME
+    mtime = os.stat(script_path).st_mtime
+    if _POOL_CUTTER is None or _POOL_CUTTER_MTIME != mtime:
+        _POOL_CUTTER = _load_module_from_path("cut_silence_to_fcpxml", script_path)
+        _POOL_CUTTER_MTIME = mtime
+    return _POOL_CUTTER.compute_plan(inp, **params)
+
+
 def _sec_to_hhmmss(t: float) -> str:
-    if t < 0:
-        t = 0.0
-    h = int(t // 3600)
-    m = int((t % 3600) // 60)
-    s = t % 60
+    # Round to whole milliseconds first so 59.9996 reads 1:00.000, not 0:60.000
+    sec, ms = divmod(round(t * 1000) if t > 0 else 0, 1000)
+    h, rem = divmod(sec, 3600)
+    m, s = divmod(rem, 60)
     if h > 0:
-        return f"{h}:{m:02d}:{s:06.3f}"
-    return f"{m}:{s:06.3f}"
+        return f"{h}:{m:02d}:{s:02d}.{ms:03d}"
+    return f"{m}:{s:02d}.{ms:03d}"
 
 
 def _settings_path_candidates() -> list[str]:
@@ -123,37 +196,131 @@ def _settings_path_candidates() -> list[str]:
     return paths
 
 
+def _stat_file(path: str):
+    # One stat() answers both "is it a regular file" and size/mtime; None when it's missing or not a file
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st if stat.S_ISREG(st.st_mode) else None
+
+
 def _ensure_parent_dir(path: str):
     d = os.path.dirname(path)
     if d and not os.path.isdir(d):
         os.makedirs(d, exist_ok=True)
 
 
+# (path, mtime, data) of the settings file last read or written; startup reads it twice and the
+# debounced save rewrites it constantly, so it's only parsed again if something else touched the file.
+_SETTINGS_CACHE = None
+# Bytes of the last successful save, to skip rewriting an identical file
+_SETTINGS_LAST_BLOB = None
+
+
 def _load_settings() -> dict:
+    global _SETTINGS_CACHE
     for p in _settings_path_candidates():
         try:
-            if os.path.isfile(p):
-                with open(p, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                if isinstance(data, dict):
-                    return data
+            mtime = os.stat(p).st_mtime
+        except OSError:
+            continue
+        if _SETTINGS_CACHE is not None and _SETTINGS_CACHE[:2] == (p, mtime):
+            return _SETTINGS_CACHE[2]
+        try:
+            with open(p, "rb") as f:
+                blob = f.read()
+            data = None
+            if _orjson is not None:
+                try:
+                    data = _orjson.loads(blob)
+                except _orjson.JSONDecodeError:
+                    # Strict where json isn't (NaN/Infinity from older files): let json have a go
+                    pass
+            if data is None:
+                data = json.loads(blob)
+            if isinstance(data, dict):
+                _SETTINGS_CACHE = (p, mtime, data)
+                return data
         except:
             pass
     return {}
 
 
 def _save_settings(data: dict) -> str | None:
+    global _SETTINGS_CACHE, _SETTINGS_LAST_BLOB
+    # Rewritten on every debounced change and carries the whole plan, so serialize in one go (compact;
+    # the stdlib only uses its C encoder without indent) and write once
+    if _orjson is not None:
+        blob = _orjson.dumps(data)
+    else:
+        blob = json.dumps(data, separators=(",", ":")).encode("utf-8")
+    # Unchanged snapshot (a setting toggled and back, a save flushed twice) and nobody touched the file since
+    if blob == _SETTINGS_LAST_BLOB and _SETTINGS_CACHE is not None:
+        p, mtime = _SETTINGS_CACHE[:2]
+        try:
+            if os.stat(p).st_mtime == mtime:
+                _SETTINGS_CACHE = (p, mtime, data)
+                return p
+        except OSError:
+            pass
     for p in _settings_path_candidates():
+        tmp = p + ".tmp"
         try:
             _ensure_parent_dir(p)
-            with open(p, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
+            # Write aside and swap in, so dying mid-write can't leave a truncated settings file
+            with open(tmp, "wb") as f:
+                f.write(blob)
+            os.replace(tmp, p)
+            _SETTINGS_CACHE = (p, os.stat(p).st_mtime, data)
+            _SETTINGS_LAST_BLOB = blob
             return p
         except:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
             continue
     return None
 
 
+_SETTINGS_WRITE_LOCK = threading.Lock()
+_SETTINGS_GEN = 0
+_SETTINGS_DONE_GEN = 0  # last snapshot generation that reached the disk (or was superseded by one that did)
+
+
+def _save_settings_async(data: dict):
+    # Called from the Tk thread; the disk write happens on a worker. Writers queue on the lock and a
+    # writer that finds a newer snapshot queued behind it skips, so the last snapshot always wins.
+    global _SETTINGS_GEN
+    _SETTINGS_GEN += 1
+    gen = _SETTINGS_GEN
+
+    def write():
+        global _SETTINGS_DONE_GEN
+        with _SETTINGS_WRITE_LOCK:
+            if gen == _SETTINGS_GEN:
+                _save_settings(data)
+                _SETTINGS_DONE_GEN = gen
+
+    threading.Thread(target=write, daemon=True).start()
+
+
+def _save_settings_now(data: dict):
+    # Synchronous save for shutdown; supersedes any async write still queued
+    global _SETTINGS_GEN, _SETTINGS_DONE_GEN
+    _SETTINGS_GEN += 1
+    gen = _SETTINGS_GEN
+    with _SETTINGS_WRITE_LOCK:
+        _save_settings(data)
+        _SETTINGS_DONE_GEN = gen
+
+
+def _settings_write_pending() -> bool:
+    # True while an async snapshot is still queued or being written
+    return _SETTINGS_DONE_GEN != _SETTINGS_GEN
+
+
 def _try_import_vlc():
     try:
         import vlc
@@ -162,23 +329,36 @@ def _try_import_vlc():
         return None, f"{type(e).__name__}: {e}"
 
 class QueueWriter:
-    def __init__(self, q, prefix=""):
+    def __init__(self, q, prefix="", notify=None):
         self.q = q
         self.prefix = prefix
-        self._buf = ""
+        self.notify = notify
+        self._buf = []
+
+    def _put(self, text):
+        self.q.put(text)
+        if self.notify:
+            self.notify()
 
     def write(self, s):
         if not s:
             return
-        self._buf += s
-        while "\n" in self._buf:
-            line, self._buf = self._buf.split("\n", 1)
-            self.q.put(self.prefix + line + "\n")
+        # Partial lines are collected as pieces and only joined once a newline arrives, so long
+        # unterminated output isn't re-copied on every write
+        self._buf.append(s)
+        if "\n" not in s:
+            return
+        done, _, rest = "".join(self._buf).rpartition("\n")
+        self._buf = [rest] if rest else []
+        if self.prefix:
+            self._put("".join(self.prefix + line + "\n" for line in done.split("\n")))
+        else:
+            self._put(done + "\n")
 
     def flush(self):
         if self._buf:
-            self.q.put(self.prefix + self._buf)
-            self._buf = ""
+            self._put(self.prefix + "".join(self._buf))
+            self._buf = []
 
 class App(tk.Tk):
     def __init__(self):
@@ -189,19 +369,57 @@ class App(tk.Tk):
         self.minsize(1040, 640)
 
         self._log_q = queue.Queue()
+        self._log_pending = False
         self._running = False
+        self._cutter_mod = None
+        self._cutter_mtime = None
+        self._cutter_lock = threading.Lock()
+        self._plan_proc = None
+        self._plan_conn = None
+        self._work_q = None
+        self._analysis_gen = 0
 
         self._restoring_session = True
         self._plan = None
-        self._playhead_sec = 0.0
+        self._plan_segs = {}
+        self._plan_duration = 0.0
+        self._plan_session_blob = None
+        self._tl_runs = {}
+        self._playhead_sec = 0.0  # always a float: every assignment converts at its source
 
         self._px_per_sec = DEFAULT_ZOOM_PX_PER_SEC
         self._timeline_total_w = 2400
+        self._sec_per_px = 0.0
         self._overview_w = 900
         self._overview_h = 34
         self._overview_dragging = False
         self._overview_drag_off = 0.0
 
+        # Persistent main-timeline canvas items (see _draw_main_timeline)
+        # Width of the timeline canvas and left edge of its view (fraction of the scrollregion), kept up
+        # to date from <Configure> and the xscrollcommand so view math needs no Tk round-trips
+        self._tl_canvas_w = 1200
+        self._tl_xview0 = 0.0
+        self._tl_bg_id = None
+        self._tl_img_id = None
+        self._tl_bufs = [None, None]
+        self._tl_buf_idx = 0
+        self._tl_strip_span = (0, 0)
+        self._tl_strip_key = None
+        self._tl_hint_id = None
+        self._tl_playhead_id = None
+        self._redraw_pending = None
+        self._playhead_px_key = None
+
+        # Persistent overview canvas items (see _draw_overview)
+        self._ov_bg_id = None
+        self._ov_img_id = None
+        self._ov_img = None
+        self._ov_hint_id = None
+        self._ov_view_id = None
+        self._ov_view_fill_id = None
+        self._ov_strip_key = None
+
         self._settings_dirty = False
         self._settings_save_after_id = None
         self._auto_load_after_id = None
@@ -222,15 +440,36 @@ class App(tk.Tk):
 
         self._vlc_instance = None
         self._vlc_player = None
+        self._vlc_media = None
+        self._vlc_time_live = False
+        self._vlc_init_failed = False
         self._vlc_loaded_path = None
         self._vlc_duration_sec = 0.0
         self._vlc_poll_after_id = None
         self._safe_seek_inflight = False
+        self._pending_seek_target = None
+        self._volume_after_id = None
+        self._vlc_parse_fn = None
+        self._vlc_parse_flag = 1
+        self._vlc_events_ok = False
+        self._vlc_event_pending = False
+        self._time_label_key = None
+        self._time_dur_key = None
+        self._time_dur_text = ""
 
         self._load_settings_into_vars()
+        # Build the whole UI while the window is unmapped so Tk lays it out once at the end instead of
+        # after every pack/grid; the theme goes first so widgets are created already styled.
+        self.withdraw()
         self._apply_dark_theme()
         self._build_ui()
+        self.update_idletasks()
+        self.deiconify()
         self._install_var_traces()
+        self.bind("<<LogReady>>", lambda e: self._drain_logs())
+        self.bind("<<TimelineDirty>>", lambda e: self._schedule_redraw())
+        self.bind("<FocusOut>", self._on_focus_out)
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
         self._tick_logs()
 
         self._install_hotkeys()
@@ -239,6 +478,9 @@ class App(tk.Tk):
 
         self.after(150, self._init_vlc_if_available)
         self.after(200, self._schedule_auto_load)
+        # Once the window and player are up, load the cutter (and numpy/onnxruntime with it) in the
+        # background so the first Analyze doesn't wait for the imports
+        self.after(400, lambda: threading.Thread(target=self._warm_load_cutter, daemon=True).start())
 
     def _apply_dark_theme(self):
         style = ttk.Style(self)
@@ -310,23 +552,24 @@ class App(tk.Tk):
         return "break"
 
     def _vlc_parse_duration_async(self, media):
-        def worker():
+        # parse_with_options returns at once and libvlc fires MediaParsedChanged when the header is read;
+        # that raises the same flag as the player events and the next _vlc_poll tick picks the duration up
+        if self._vlc_parse_fn is not None:
             try:
-                # Ask VLC to parse metadata so duration becomes available without playing.
-                parse = getattr(media, "parse_with_options", None)
-                if callable(parse):
-                    # local = 1 in some builds; flags enum varies across VLC versions
-                    flag = getattr(self._vlc, "MediaParseFlag", None)
-                    local_flag = getattr(flag, "local", 1) if flag else 1
-                    parse(local_flag, timeout=1500)
-                else:
-                    # Older VLC binding
-                    media.parse()
+                media.event_manager().event_attach(self._vlc.EventType.MediaParsedChanged, self._on_vlc_event)
+                self._vlc_parse_fn(media, self._vlc_parse_flag, timeout=2000)
+                return
+            except:
+                pass
 
+        def worker():
+            try:
+                # Older VLC binding: parse() blocks until the metadata is in
+                media.parse()
                 dur_ms = media.get_duration()
                 if dur_ms and dur_ms > 0:
                     self._vlc_duration_sec = float(dur_ms) / 1000.0
-                    self.after(0, self._draw_all_timelines)
+                    self._request_redraw_from_thread()
             except:
                 pass
 
@@ -337,29 +580,30 @@ class App(tk.Tk):
         sess = {
             "px_per_sec": float(self._px_per_sec),
             "playhead_sec": float(self._playhead_sec),
-            "xview": float(self.timeline_canvas.xview()[0]) if hasattr(self, "timeline_canvas") else 0.0,
+            # Tracked from the canvas's xscrollcommand, so saving doesn't ask Tcl for it
+            "xview": float(self._tl_xview0),
         }
 
         path = self.input_path.get().strip()
-        if path and os.path.isfile(path):
-            try:
-                st = os.stat(path)
-                sess["file_size"] = int(st.st_size)
-                sess["file_mtime"] = float(st.st_mtime)
-            except:
-                pass
+        st = _stat_file(path) if path else None
+        if st is not None:
+            sess["file_size"] = int(st.st_size)
+            sess["file_mtime"] = float(st.st_mtime)
 
         # Store analysis plan so reopening shows it instantly
         if self._plan:
-            # Keep it JSON-safe and small
-            sess["plan"] = {
-                "duration": float(self._plan.get("duration", 0.0)),
-                "kept_total": float(self._plan.get("kept_total", 0.0)),
-                "removed_total": float(self._plan.get("removed_total", 0.0)),
-                "keeps_count": int(self._plan.get("keeps_count", 0)),
-                "keeps": [(float(a), float(b)) for a, b in self._plan.get("keeps", [])],
-                "removes": [(float(a), float(b)) for a, b in self._plan.get("removes", [])],
-            }
+            # Keep it JSON-safe and small. Built once per plan (_set_plan drops it): every debounced
+            # save of a slider or checkbox would otherwise rebuild the whole segment list.
+            if self._plan_session_blob is None:
+                self._plan_session_blob = {
+                    "duration": float(self._plan.get("duration", 0.0)),
+                    "kept_total": float(self._plan.get("kept_total", 0.0)),
+                    "removed_total": float(self._plan.get("removed_total", 0.0)),
+                    "keeps_count": int(self._plan.get("keeps_count", 0)),
+                    "keeps": list(self._plan_pairs("keeps")),
+                    "removes": list(self._plan_pairs("removes")),
+                }
+            sess["plan"] = self._plan_session_blob
 
         return {
             "input_path": self.input_path.get(),
@@ -392,17 +636,50 @@ class App(tk.Tk):
         self._apply_settings(data if data else dict(DEFAULTS))
 
     def _mark_settings_dirty(self, *_):
+        # A slider drag writes its variable dozens of times; the first change arms one lazy save and the
+        # rest only mark it dirty. Focus-out, Analyze/Generate and closing the window flush sooner.
         self._settings_dirty = True
-        if self._settings_save_after_id is not None:
-            self.after_cancel(self._settings_save_after_id)
-        self._settings_save_after_id = self.after(300, self._flush_settings_save)
+        if self._settings_save_after_id is None:
+            self._settings_save_after_id = self.after(2000, self._flush_settings_save)
 
     def _flush_settings_save(self):
-        self._settings_save_after_id = None
+        if self._settings_save_after_id is not None:
+            self.after_cancel(self._settings_save_after_id)
+            self._settings_save_after_id = None
         if not self._settings_dirty:
             return
         self._settings_dirty = False
-        _save_settings(self._collect_settings())
+        # Tk variables are read here on the Tk thread; only the serialize + write moves off it
+        _save_settings_async(self._collect_settings())
+
+    def _on_focus_out(self, ev):
+        # Bound on the toplevel, so this also sees focus moving between its widgets; only leaving the window counts
+        if ev.widget is self:
+            self._flush_settings_save()
+
+    def _on_close(self):
+        if self._settings_save_after_id is not None:
+            self.after_cancel(self._settings_save_after_id)
+            self._settings_save_after_id = None
+        # The writer threads are daemons and die with the process, so the last save is done here: for
+        # unsaved changes, and for a flush (focus-out, Analyze, Generate) whose write hasn't landed yet
+        if self._settings_dirty or _settings_write_pending():
+            self._settings_dirty = False
+            _save_settings_now(self._collect_settings())
+        self._stop_plan_process()
+        self.destroy()
+
+    def _stop_plan_process(self):
+        # A VAD analysis still running in the child would otherwise keep going after the window is gone
+        proc, conn = self._plan_proc, self._plan_conn
+        self._plan_proc = self._plan_conn = None
+        if proc is None:
+            return
+        try:
+            conn.close()
+            proc.terminate()
+        except:
+            pass
 
     def reset_defaults(self):
         self._apply_settings(dict(DEFAULTS))
@@ -444,9 +721,9 @@ class App(tk.Tk):
         try:
             path = self.input_path.get().strip()
             ok = True
-            if path and os.path.isfile(path):
+            st = _stat_file(path) if path else None
+            if st is not None:
                 self._vlc_load_media(path)
-                st = os.stat(path)
                 fs = sess.get("file_size", None)
                 fm = sess.get("file_mtime", None)
                 if fs is not None and int(fs) != int(st.st_size):
@@ -458,14 +735,15 @@ class App(tk.Tk):
 
             plan = sess.get("plan", None)
             if ok and isinstance(plan, dict):
-                self._plan = {
+                self._set_plan({
                     "duration": float(plan.get("duration", 0.0)),
                     "kept_total": float(plan.get("kept_total", 0.0)),
                     "removed_total": float(plan.get("removed_total", 0.0)),
                     "keeps_count": int(plan.get("keeps_count", 0)),
-                    "keeps": [(float(a), float(b)) for a, b in plan.get("keeps", [])],
-                    "removes": [(float(a), float(b)) for a, b in plan.get("removes", [])],
-                }
+                    # Straight into _set_plan's float arrays, no intermediate list of tuples
+                    "keeps": plan.get("keeps", []),
+                    "removes": plan.get("removes", []),
+                })
 
                 dur = self._plan["duration"]
                 self.preview_status.set(
@@ -473,16 +751,16 @@ class App(tk.Tk):
                     f"Cut {_sec_to_hhmmss(self._plan['removed_total'])} · Segments {self._plan['keeps_count']}"
                 )
             else:
-                self._plan = None
+                self._set_plan(None)
         except:
-            self._plan = None
+            self._set_plan(None)
 
         # Draw and restore scroll/viewport
         self._draw_all_timelines()
         try:
             xv = float(sess.get("xview", 0.0))
             xv = max(0.0, min(1.0, xv))
-            self.timeline_canvas.xview_moveto(xv)
+            self._timeline_xview_moveto(xv)
         except:
             pass
 
@@ -603,15 +881,17 @@ class App(tk.Tk):
         timeline_box = ttk.Frame(player_box)
         timeline_box.pack(fill="x", pady=(10, 0))
 
-        self.timeline_canvas = tk.Canvas(timeline_box, height=66, highlightthickness=1)
+        self.timeline_canvas = tk.Canvas(timeline_box, height=TIMELINE_H, highlightthickness=1)
         self.timeline_canvas.pack(side="top", fill="x", expand=True)
         self.timeline_canvas.bind("<Button-1>", self.on_timeline_click)
-        self.timeline_canvas.bind("<Configure>", lambda e: self._draw_all_timelines())
+        # Scrubbing: same path as a click, which only moves the playhead lines and coalesces the seeks
+        self.timeline_canvas.bind("<B1-Motion>", self.on_timeline_click)
+        self.timeline_canvas.bind("<Configure>", self._on_timeline_configure)
         self.timeline_canvas.bind("<MouseWheel>", self.on_timeline_mousewheel)
 
         self.timeline_scroll = ttk.Scrollbar(timeline_box, orient="horizontal", command=self.timeline_canvas.xview)
         self.timeline_scroll.pack(side="bottom", fill="x")
-        self.timeline_canvas.configure(xscrollcommand=self.timeline_scroll.set)
+        self.timeline_canvas.configure(xscrollcommand=self._on_timeline_xscroll)
 
         # Premiere-style overview / dragger
         overview_box = ttk.Frame(player_box)
@@ -619,7 +899,7 @@ class App(tk.Tk):
 
         self.overview_canvas = tk.Canvas(overview_box, height=self._overview_h, highlightthickness=1)
         self.overview_canvas.pack(fill="x")
-        self.overview_canvas.bind("<Configure>", lambda e: self._draw_all_timelines())
+        self.overview_canvas.bind("<Configure>", lambda e: self._schedule_redraw())
         self.overview_canvas.bind("<Button-1>", self.on_overview_down)
         self.overview_canvas.bind("<B1-Motion>", self.on_overview_drag)
         self.overview_canvas.bind("<ButtonRelease-1>", self.on_overview_up)
@@ -628,6 +908,10 @@ class App(tk.Tk):
         log_box.pack(fill="both", expand=False, pady=(10, 0))
         self.log = tk.Text(log_box, height=10, wrap="word")
         self.log.pack(fill="both", expand=True)
+        # _append_log runs for every line a run prints; bind its Text methods once
+        self._log_insert = self.log.insert
+        self._log_index = self.log.index
+        self._log_see = self.log.see
 
         c = self._theme_colors
         self.log.configure(bg=c["panel2"], fg=c["fg"], insertbackground=c["fg"], selectbackground="#2b4a7a",
@@ -640,23 +924,52 @@ class App(tk.Tk):
             "- Pick a file: auto-loads into the player.\n"
             "- Ctrl + Mousewheel on the timeline to zoom.\n"
             "- Drag the small overview viewport like Premiere to pan.\n"
-            "- Click the main timeline to seek.\n\n"
+            "- Click or drag on the main timeline to seek; Shift+click snaps to the nearest cut edge.\n\n"
         )
 
         self._draw_all_timelines()
 
     def _append_log(self, s: str):
-        self.log.insert("end", s)
-        self.log.see("end")
+        self._log_insert("end", s)
+        # Keep the widget bounded so a long session doesn't grow it forever. Trim a whole block at once
+        # so a chatty run doesn't pay for a delete (and re-layout) on every tick once it hits the cap.
+        if int(self._log_index("end-1c").split(".")[0]) > LOG_MAX_LINES:
+            self.log.delete("1.0", f"end - {LOG_MAX_LINES - LOG_TRIM_LINES} lines")
+        self._log_see("end")
+
+    def _post_log(self, s: str):
+        # Safe from worker threads
+        self._log_q.put(s)
+        self._notify_log()
+
+    def _notify_log(self):
+        # Workers wake the Tk loop with a virtual event instead of it polling the queue. One pending
+        # event is enough however many lines arrive before it is handled.
+        if self._log_pending:
+            return
+        self._log_pending = True
+        try:
+            self.event_generate("<<LogReady>>", when="tail")
+        except (tk.TclError, RuntimeError):
+            # Window going away; the safety drain (or nobody) picks it up
+            pass
 
     def _tick_logs(self):
+        # Slow safety net in case a <<LogReady>> event got lost
+        self._drain_logs()
+        self.after(LOG_SAFETY_DRAIN_MS, self._tick_logs)
+
+    def _drain_logs(self):
+        # Drain everything queued so far and hand it to the Text widget in one insert
+        self._log_pending = False
+        msgs = []
         try:
             while True:
-                msg = self._log_q.get_nowait()
-                self._append_log(msg)
+                msgs.append(self._log_q.get_nowait())
         except queue.Empty:
             pass
-        self.after(50, self._tick_logs)
+        if msgs:
+            self._append_log("".join(msgs))
 
     def _set_running(self, running: bool):
         self._running = running
@@ -678,44 +991,139 @@ class App(tk.Tk):
     def _auto_load_if_needed(self):
         self._auto_load_after_id = None
         path = self.input_path.get().strip()
-        if not path or not os.path.isfile(path):
+        # The trace fires on every keystroke and programmatic set; an unchanged path needs no syscall
+        if not path or path == self._last_auto_loaded_path:
             return
-        if path == self._last_auto_loaded_path:
+        if _stat_file(path) is None:
             return
         self._last_auto_loaded_path = path
         self._vlc_load_media(path)
 
     # ---------------- Cutter module ----------------
     def _load_cutter(self):
+        # Executed once per version of the script; later Analyze/Generate clicks reuse the module (and its
+        # ffprobe caches). Editing the script while the GUI runs picks up the new one on the next click.
         sp = _script_path()
-        if not os.path.isfile(sp):
+        st = _stat_file(sp)
+        if st is None:
             raise RuntimeError(f"Couldn't find {SCRIPT_NAME}.\nExpected at:\n{sp}")
-        return _load_module_from_path("cut_silence_to_fcpxml", sp)
+        if self._cutter_mod is not None and self._cutter_mtime == st.st_mtime:
+            return self._cutter_mod
+        # Analyze and Generate workers can both get here first; only one of them may execute the module
+        with self._cutter_lock:
+            if self._cutter_mod is None or self._cutter_mtime != st.st_mtime:
+                self._cutter_mod = _load_module_from_path("cut_silence_to_fcpxml", sp)
+                self._cutter_mtime = st.st_mtime
+            return self._cutter_mod
+
+    def _warm_load_cutter(self):
+        try:
+            self._load_cutter()
+        except Exception:
+            # Analyze/Generate load it again and report the error where the user sees it
+            pass
+
+    def _build_params(self) -> dict:
+        # Keys match compute_plan's keyword arguments
+        return {
+            "threshold": float(self.threshold.get()),
+            "min_silence": float(self.min_silence.get()),
+            "pad": float(self.pad.get()),
+            "min_keep": float(self.min_keep.get()),
+            "audio_stream": self.audio_stream.get().strip() or None,
+            "use_vad": bool(self.use_vad.get()),
+        }
 
     def _build_argv(self, inp: str):
-        argv = [inp, "--threshold", str(self.threshold.get()), "--min_silence", str(self.min_silence.get()), "--pad",
-                str(self.pad.get()), "--min_keep", str(self.min_keep.get())]
-        aud = self.audio_stream.get().strip()
-        if aud:
-            argv += ["--audio_stream", aud]
+        p = self._build_params()
+        argv = [inp, "--threshold", str(p["threshold"]), "--min_silence", str(p["min_silence"]), "--pad",
+                str(p["pad"]), "--min_keep", str(p["min_keep"])]
+        if p["audio_stream"]:
+            argv += ["--audio_stream", p["audio_stream"]]
         if self.regen_mono.get():
             argv += ["--regen_mono"]
-        if self.use_vad.get():
+        if p["use_vad"]:
             argv += ["--use_vad"]
         return argv
 
     # ---------------- Timeline helpers ----------------
+    def _set_plan(self, plan):
+        # The segments live only as flat start/end arrays, so drawing can bisect straight to the visible
+        # ones and a long recording doesn't keep tens of thousands of tuples alive. _plan keeps the
+        # scalar fields; use _plan_pairs() to walk the segments.
+        self._plan_segs = {}
+        self._plan_session_blob = None
+        self._tl_runs = {}
+        self._tl_strip_key = None
+        self._ov_strip_key = None
+        if plan:
+            for kind in ("keeps", "removes"):
+                segs = sorted(plan[kind])
+                starts, ends = zip(*segs) if segs else ((), ())
+                self._plan_segs[kind] = (array("d", starts), array("d", ends))
+            plan = {k: v for k, v in plan.items() if k not in ("keeps", "removes")}
+        self._plan = plan
+        self._plan_duration = float(plan.get("duration", 0.0)) if plan else 0.0
+
+    def _plan_pairs(self, kind: str):
+        starts, ends = self._plan_segs.get(kind, ((), ()))
+        return zip(starts, ends)
+
+    def _pixel_runs(self, kind: str, w: int):
+        # The plan's segments in whole pixels of a strip w pixels wide (the zoomed timeline or the
+        # overview): sub-pixel slivers dropped and runs that touch merged. Cached per plan and width.
+        runs = self._tl_runs.get((kind, w))
+        if runs is None:
+            if len(self._tl_runs) >= 8:
+                # Zooming visits many widths; only the current few are worth keeping
+                self._tl_runs.clear()
+            x0s, x1s = array("q"), array("q")
+            dur = self._timeline_duration()
+            starts, ends = self._plan_segs.get(kind, ((), ()))
+            if dur > 0 and _np is not None and len(starts) > 64:
+                self._pixel_runs_np(starts, ends, w / dur, x0s, x1s)
+            elif dur > 0:
+                scale = w / dur
+                for a, b in zip(starts, ends):
+                    x0, x1 = int(a * scale), int(b * scale)
+                    if x1 <= x0:
+                        continue
+                    if x1s and x0 <= x1s[-1]:
+                        if x1 > x1s[-1]:
+                            x1s[-1] = x1
+                    else:
+                        x0s.append(x0)
+                        x1s.append(x1)
+            runs = self._tl_runs[(kind, w)] = (x0s, x1s)
+        return runs
+
+    @staticmethod
+    def _pixel_runs_np(starts, ends, scale: float, x0s, x1s):
+        # Same result as the loop in _pixel_runs: int() and astype both truncate toward zero
+        xa = (_np.frombuffer(starts, dtype=_np.float64) * scale).astype(_np.int64)
+        xb = (_np.frombuffer(ends, dtype=_np.float64) * scale).astype(_np.int64)
+        keep = xb > xa
+        xa, xb = xa[keep], xb[keep]
+        if not len(xa):
+            return
+        # Starts are sorted, so a segment opens a new run exactly when it starts past every end so far
+        reach = _np.maximum.accumulate(xb)
+        first = _np.flatnonzero(_np.concatenate(([True], xa[1:] > reach[:-1])))
+        x0s.frombytes(xa[first].tobytes())
+        x1s.frombytes(_np.maximum.reduceat(xb, first).tobytes())
+
     def _timeline_duration(self) -> float:
-        if self._plan and float(self._plan.get("duration", 0.0)) > 0:
-            return float(self._plan["duration"])
+        # Asked by every draw, poll and jump; the plan's duration is converted once in _set_plan
+        if self._plan_duration > 0:
+            return self._plan_duration
         if self._vlc_duration_sec > 0:
-            return float(self._vlc_duration_sec)
+            return self._vlc_duration_sec
         return 0.0
 
     def _compute_timeline_width(self) -> int:
         dur = self._timeline_duration()
         if dur <= 0:
-            return max(1200, int(self.timeline_canvas.winfo_width() or 1200))
+            return max(1200, self._tl_canvas_w)
         w = int(dur * float(self._px_per_sec))
         return max(1200, w)
 
@@ -735,20 +1143,31 @@ class App(tk.Tk):
         dur = self._timeline_duration()
         if dur <= 0:
             return 0.0, 0.0
-        x0 = self.timeline_canvas.canvasx(0)
-        x1 = self.timeline_canvas.canvasx(self.timeline_canvas.winfo_width())
-        return self._x_to_sec(x0), self._x_to_sec(x1)
+        x0 = self._tl_xview0 * self._timeline_total_w
+        return self._x_to_sec(x0), self._x_to_sec(x0 + self._tl_canvas_w)
 
-    def _set_view_center_time(self, t_center: float):
+    def _set_view_center_time(self, t_center: float) -> bool:
+        # True if the view actually scrolled; near either end the clamp often leaves it where it was
         dur = self._timeline_duration()
         if dur <= 0:
-            return
+            return False
         w = float(self._timeline_total_w)
-        canvas_w = max(1, float(self.timeline_canvas.winfo_width()))
+        canvas_w = float(self._tl_canvas_w)
         x_center = self._sec_to_x(t_center)
         x0 = x_center - canvas_w * 0.5
         x0 = max(0.0, min(w - canvas_w, x0))
-        self.timeline_canvas.xview_moveto(x0 / w)
+        if int(x0) == int(self._tl_xview0 * w):
+            return False
+        self._timeline_xview_moveto(x0 / w)
+        return True
+
+    def _timeline_xview_moveto(self, frac: float):
+        self._tl_xview0 = frac
+        self.timeline_canvas.xview_moveto(frac)
+
+    def _on_timeline_configure(self, ev):
+        self._tl_canvas_w = max(1, int(ev.width))
+        self._schedule_redraw()
 
     # ---------------- Draw timelines ----------------
     def _draw_all_timelines(self):
@@ -756,96 +1175,248 @@ class App(tk.Tk):
         self._draw_main_timeline()
         self._draw_overview()
 
+    def _schedule_redraw(self):
+        # Resizes, drags, jumps and the player poll can each ask for a redraw several times per
+        # event-loop turn; coalesce them into one draw once the pending events are handled. Paths
+        # that need the new scrollregion straight away (zoom, session restore) still draw directly.
+        if self._redraw_pending is None:
+            self._redraw_pending = self.after_idle(self._do_redraw)
+
+    def _request_redraw_from_thread(self):
+        # Worker threads only post an event; the Tk side folds it into the usual coalesced redraw
+        try:
+            self.event_generate("<<TimelineDirty>>", when="tail")
+        except (tk.TclError, RuntimeError):
+            pass
+
+    def _do_redraw(self):
+        self._redraw_pending = None
+        self._draw_all_timelines()
+
     def _draw_main_timeline(self):
         c = self.timeline_canvas
-        c.delete("all")
-        h = 66
-        pad_y = 10
-        y0, y1 = pad_y, h - pad_y
+        h = TIMELINE_H
+        y0, y1 = TIMELINE_BAR_Y0, TIMELINE_BAR_Y1
         w = self._timeline_total_w
 
         c.config(scrollregion=(0, 0, w, h))
-        c.create_rectangle(0, y0, w, y1, outline="", fill="#222222")
+        if self._tl_bg_id is None:
+            # Items that always exist are created once and only moved/shown/hidden afterwards
+            self._tl_bg_id = c.create_rectangle(0, y0, w, y1, outline="", fill="#222222")
+            self._tl_img_id = c.create_image(0, y0, anchor="nw")
+            self._tl_hint_id = c.create_text(12, h // 2, anchor="w", fill="#bbbbbb",
+                                             text="(load a file to enable timeline)")
+            self._tl_playhead_id = c.create_line(0, 0, 0, h, fill="#ffffff", width=2, tags=("playhead",))
+        else:
+            c.coords(self._tl_bg_id, 0, y0, w, y1)
 
         dur = self._timeline_duration()
+        self._sec_per_px = dur / float(w) if dur > 0 else 0.0
         if dur <= 0:
-            c.create_text(12, h // 2, anchor="w", fill="#bbbbbb", text="(load a file to enable timeline)")
+            c.itemconfigure(self._tl_hint_id, state="normal")
+            c.itemconfigure(self._tl_img_id, state="hidden")
+            c.itemconfigure(self._tl_playhead_id, state="hidden")
             return
+        c.itemconfigure(self._tl_hint_id, state="hidden")
+        c.itemconfigure(self._tl_img_id, state="normal")
+        c.itemconfigure(self._tl_playhead_id, state="normal")
 
-        if self._plan:
-            removes = self._plan["removes"]
-            keeps = self._plan["keeps"]
-            for a, b in removes:
-                x0, x1 = self._sec_to_x(a), self._sec_to_x(b)
-                if x1 > x0:
-                    c.create_rectangle(x0, y0, x1, y1, outline="", fill="#8a2d2d")
-            for a, b in keeps:
-                x0, x1 = self._sec_to_x(a), self._sec_to_x(b)
-                if x1 > x0:
-                    c.create_rectangle(x0, y0, x1, y1, outline="", fill="#2d8a45")
-
-        step = 10 if dur <= 120 else 30 if dur <= 600 else 60
-        t = 0.0
-        while t <= dur:
-            x = self._sec_to_x(t)
-            c.create_line(x, y1, x, y1 + 6, fill="#aaaaaa")
-            t += step
-
-        xph = self._sec_to_x(self._playhead_sec)
-        c.create_line(xph, 0, xph, h, fill="#ffffff", width=2, tags=("playhead",))
+        self._render_timeline_strip()
+
+        xph = self._playhead_sec * (w / dur)
+        c.coords(self._tl_playhead_id, xph, 0, xph, h)
+        self._playhead_px_key = None
+        c.tag_raise("playhead")
+
+    def _timeline_view_px(self) -> tuple[int, int]:
+        w = self._timeline_total_w
+        x0 = int(self._tl_xview0 * w)
+        return max(0, x0), min(w, x0 + self._tl_canvas_w + 1)
+
+    def _render_timeline_strip(self):
+        # The keep/cut bar and the ruler ticks under it are a bitmap of just the part of the timeline
+        # around the view: one PhotoImage filled with one put() per segment or tick, shown through a
+        # single canvas image item. It spans the viewport plus one viewport width either side, so small
+        # scrolls don't need a re-render.
+        c = self.timeline_canvas
+        w = self._timeline_total_w
+        vx0, vx1 = self._timeline_view_px()
+        buf = max(1, vx1 - vx0)
+        vx0 = max(0, vx0 - buf)
+        vx1 = min(w, vx1 + buf)
+        # Nothing to do if the same span of the same plan at the same zoom is already up
+        key = (w, vx0, vx1, self._timeline_duration())
+        if key == self._tl_strip_key:
+            return
+        self._tl_strip_key = key
+        self._tl_strip_span = (vx0, vx1)
+        iw = max(1, vx1 - vx0)
+        ih = TIMELINE_BAR_Y1 - TIMELINE_BAR_Y0
+        th = ih + 6
+
+        # Paint into the buffer that isn't on screen and swap it in at the end: puts into the displayed
+        # image would each make the canvas queue a repaint of the damaged area.
+        back = self._tl_buf_idx ^ 1
+        img = self._tl_bufs[back]
+        if img is None or img.width() != iw:
+            img = self._tl_bufs[back] = tk.PhotoImage(width=iw, height=th)
+        else:
+            # The ruler rows stay transparent apart from the ticks, so the canvas background shows through
+            img.blank()
+        img.put("#222222", to=(0, 0, iw, ih))
+
+        if self._plan_segs and self._timeline_duration() > 0:
+            # Keeps are filled after cuts so they win where the two touch, like the old stacking order
+            for kind, color in (("removes", "#8a2d2d"), ("keeps", "#2d8a45")):
+                x0s, x1s = self._pixel_runs(kind, w)
+                for i in range(bisect.bisect_right(x1s, vx0), bisect.bisect_left(x0s, vx1)):
+                    x0 = max(vx0, x0s[i])
+                    x1 = min(vx1, x1s[i])
+                    if x1 > x0:
+                        img.put(color, to=(x0 - vx0, 0, x1 - vx0, ih))
+
+        # Ticks go in the rows below the bar instead of being canvas line items of their own
+        dur = self._timeline_duration()
+        if dur > 0:
+            scale = w / dur
+            step = 10 if dur <= 120 else 30 if dur <= 600 else 60
+            t = math.ceil(vx0 / scale / step) * step
+            t_end = min(dur, vx1 / scale)
+            while t <= t_end:
+                x = min(iw - 1, int(round(t * scale)) - vx0)
+                img.put("#aaaaaa", to=(x, ih, x + 1, th))
+                t += step
+
+        c.itemconfigure(self._tl_img_id, image=img)
+        c.coords(self._tl_img_id, vx0, TIMELINE_BAR_Y0)
+        self._tl_buf_idx = back
+
+    def _on_timeline_xscroll(self, first, last):
+        self.timeline_scroll.set(first, last)
+        # Tk reports the clamped position here after every scroll, moveto and scrollregion change
+        self._tl_xview0 = float(first)
+        if self._tl_img_id is None or self._timeline_duration() <= 0:
+            return
+        self._update_overview_viewport()
+        # The strip only covers the area around the view; re-render once the view has eaten into
+        # more than half of the buffer on either side.
+        bx0, bx1 = self._tl_strip_span
+        vx0, vx1 = self._timeline_view_px()
+        margin = (vx1 - vx0) // 2
+        if vx0 < bx0 or vx1 > bx1 \
+                or (bx0 > 0 and vx0 < bx0 + margin) \
+                or (bx1 < self._timeline_total_w and vx1 > bx1 - margin):
+            self._render_timeline_strip()
 
     def _draw_overview(self):
         o = self.overview_canvas
-        o.delete("all")
-
         ow = max(1, int(o.winfo_width() or self._overview_w))
         oh = self._overview_h
         self._overview_w = ow
 
         o.config(scrollregion=(0, 0, ow, oh))
-        o.create_rectangle(0, 0, ow, oh, outline="", fill="#1b1b1b")
+        if self._ov_bg_id is None:
+            # Like the main timeline: fixed items are created once and only moved/shown/hidden afterwards
+            self._ov_bg_id = o.create_rectangle(0, 0, ow, oh, outline="", fill="#1b1b1b")
+            self._ov_img_id = o.create_image(0, OVERVIEW_BAR_PAD, anchor="nw")
+            self._ov_hint_id = o.create_text(10, oh // 2, anchor="w", fill="#bbbbbb", text="(overview)")
+            self._ov_view_id = o.create_rectangle(0, 3, 0, oh - 3, outline="#dddddd", width=2, fill="")
+            self._ov_view_fill_id = o.create_rectangle(0, 3, 0, oh - 3, outline="", fill="#ffffff",
+                                                       stipple="gray12")
+            o.create_line(0, 0, 0, oh, fill="#ffffff", width=1, tags=("playhead",))
+        else:
+            o.coords(self._ov_bg_id, 0, 0, ow, oh)
 
         dur = self._timeline_duration()
+        live = "normal" if dur > 0 else "hidden"
+        o.itemconfigure(self._ov_hint_id, state="hidden" if dur > 0 else "normal")
+        o.itemconfigure(self._ov_img_id, state=live if self._plan else "hidden")
+        for item in (self._ov_view_id, self._ov_view_fill_id, "playhead"):
+            o.itemconfigure(item, state=live)
         if dur <= 0:
-            o.create_text(10, oh // 2, anchor="w", fill="#bbbbbb", text="(overview)")
             return
 
-        def ox(t: float) -> float:
-            return (t / dur) * ow
-
         if self._plan:
-            for a, b in self._plan["removes"]:
-                x0, x1 = ox(a), ox(b)
-                if x1 > x0:
-                    o.create_rectangle(x0, 6, x1, oh - 6, outline="", fill="#6c2a2a")
-            for a, b in self._plan["keeps"]:
-                x0, x1 = ox(a), ox(b)
-                if x1 > x0:
-                    o.create_rectangle(x0, 6, x1, oh - 6, outline="", fill="#2a6c3f")
-
-        # Viewport rectangle
-        v0, v1 = self._visible_range_sec()
-        vx0, vx1 = ox(v0), ox(v1)
+            self._render_overview_strip(ow, oh - 2 * OVERVIEW_BAR_PAD)
+        self._update_overview_viewport()
+
+        px = self._playhead_sec * (ow / dur)
+        o.coords("playhead", px, 0, px, oh)
+        self._playhead_px_key = None
+
+    def _render_overview_strip(self, ow: int, ih: int):
+        # The coloured strip only depends on the plan and the overview size, so it is rendered once into
+        # a PhotoImage and reused while panning, zooming and playing. One row of pixel colours is built
+        # from the merged keep runs (cut colour elsewhere: removes are exactly the gaps between keeps)
+        # and a single put() tiles it down the whole image.
+        if self._ov_strip_key == (ow, ih):
+            return
+        self._ov_strip_key = (ow, ih)
+        img = self._ov_img
+        if img is None or img.width() != ow or img.height() != ih:
+            img = self._ov_img = tk.PhotoImage(width=ow, height=ih)
+            self.overview_canvas.itemconfigure(self._ov_img_id, image=img)
+        row = ["#6c2a2a"] * ow
+        x0s, x1s = self._pixel_runs("keeps", ow)
+        for x0, x1 in zip(x0s, x1s):
+            row[x0:x1] = ["#2a6c3f"] * (x1 - x0)
+        img.put("{" + " ".join(row) + "}", to=(0, 0, ow, ih))
+
+    def _update_overview_viewport(self):
+        dur = self._timeline_duration()
+        if self._ov_view_id is None or dur <= 0:
+            return
+        # Main-timeline pixels map straight onto overview pixels
+        kx = self._overview_w / float(self._timeline_total_w)
+        x0 = self._tl_xview0 * self._timeline_total_w
+        vx0, vx1 = x0 * kx, (x0 + self._tl_canvas_w) * kx
         vx1 = max(vx1, vx0 + 12)
+        oh = self._overview_h
+        self.overview_canvas.coords(self._ov_view_id, vx0, 3, vx1, oh - 3)
+        self.overview_canvas.coords(self._ov_view_fill_id, vx0, 3, vx1, oh - 3)
 
-        o.create_rectangle(vx0, 3, vx1, oh - 3, outline="#dddddd", width=2, fill="")
-        o.create_rectangle(vx0, 3, vx1, oh - 3, outline="", fill="#ffffff", stipple="gray12")
-
-        # Playhead
-        px = ox(self._playhead_sec)
-        o.create_line(px, 0, px, oh, fill="#ffffff", width=1)
+    def _update_playhead_only(self):
+        # A moving playhead (playback, clicks) only needs the two playhead lines moved; the strip, ticks
+        # and overview segments stay as they are.
+        dur = self._timeline_duration()
+        if dur <= 0 or self._tl_playhead_id is None:
+            return
+        t = self._playhead_sec
+        xph = t * (self._timeline_total_w / dur)
+        px = t * (self._overview_w / dur)
+        # Player time updates land here many times a second; at low zoom, or paused, the lines would not move a pixel
+        key = (int(xph), int(px), self._timeline_total_w, self._overview_w)
+        if key == self._playhead_px_key:
+            return
+        self._playhead_px_key = key
+        self.timeline_canvas.coords(self._tl_playhead_id, xph, 0, xph, TIMELINE_H)
+        self.overview_canvas.coords("playhead", px, 0, px, self._overview_h)
 
     # ---------------- Interactions ----------------
     def on_timeline_click(self, ev):
         dur = self._timeline_duration()
         if dur <= 0:
             return
+        w = self._timeline_total_w
         x = self.timeline_canvas.canvasx(ev.x)
-        x = max(0.0, min(float(self._timeline_total_w), float(x)))
-        t = self._x_to_sec(x)
-        self._playhead_sec = float(t)
+        x = 0.0 if x < 0 else w if x > w else x
+        # Scale cached by the last draw; the duration can arrive from VLC a moment before that redraw
+        t = x * (self._sec_per_px or dur / float(w))
+        if ev.state & 0x0001:  # Shift: snap to the nearest keep/cut edge
+            t = self._nearest_edge(t)
+        self._playhead_sec = t
         self._safe_seek_player(self._playhead_sec)
-        self._draw_all_timelines()
+        self._update_playhead_only()
+
+    def _nearest_edge(self, t: float) -> float:
+        # Keeps are disjoint and sorted, so both their start and end arrays are sorted: two bisects
+        best = None
+        for edges in self._plan_segs.get("keeps", ()):
+            i = bisect.bisect_left(edges, t)
+            for e in edges[max(0, i - 1):i + 1]:
+                if best is None or abs(e - t) < abs(best - t):
+                    best = e
+        return t if best is None else best
 
     def on_timeline_mousewheel(self, ev):
         # Ctrl+wheel zoom (premiere-ish)
@@ -871,7 +1442,7 @@ class App(tk.Tk):
         self._timeline_total_w = self._compute_timeline_width()
         self._draw_main_timeline()
         self._set_view_center_time(t_anchor)
-        self._draw_overview()
+        self._schedule_redraw()
 
     def on_overview_down(self, ev):
         dur = self._timeline_duration()
@@ -903,13 +1474,15 @@ class App(tk.Tk):
         x = x - float(self._overview_drag_off)
         x = max(0.0, min(float(self._overview_w), x))
         t_center = (x / float(self._overview_w)) * dur
-        self._set_view_center_time(t_center)
-        self._draw_overview()
+        # Dragging past either end of the strip leaves the view clamped where it is
+        if self._set_view_center_time(t_center):
+            self._schedule_redraw()
 
     # ---------------- Analyze ----------------
     def analyze_preview(self):
         if self._running:
             return
+        self._flush_settings_save()
 
         inp = self.input_path.get().strip()
         if not inp or not os.path.isfile(inp):
@@ -917,142 +1490,183 @@ class App(tk.Tk):
             return
 
         self.preview_status.set("Analyzing…")
-        self._plan = None
-        self._draw_all_timelines()
+        self._set_plan(None)
+        self._schedule_redraw()
 
-        threshold = float(self.threshold.get())
-        min_silence = float(self.min_silence.get())
-        pad = float(self.pad.get())
-        min_keep = float(self.min_keep.get())
-        audio_stream = self.audio_stream.get().strip() or None
+        params = self._build_params()
+        # Analyses queue on one worker; only the newest click's result is allowed to land
+        self._analysis_gen += 1
+        gen = self._analysis_gen
 
         def worker():
-            outw = QueueWriter(self._log_q, "")
-            errw = QueueWriter(self._log_q, "")
+            if gen != self._analysis_gen:
+                return
+            # One writer for both streams keeps stdout/stderr lines from splicing into each other
+            logw = QueueWriter(self._log_q, notify=self._notify_log)
 
             try:
                 mod = self._load_cutter()
                 if not hasattr(mod, "compute_plan"):
                     raise RuntimeError("cut_silence_to_fcpxml.py is missing compute_plan(...).")
 
-                with contextlib.redirect_stdout(outw), contextlib.redirect_stderr(errw):
-                    plan = mod.compute_plan(inp, threshold, min_silence, pad, min_keep, audio_stream,
-                                            use_vad=bool(self.use_vad.get()))
+                with contextlib.redirect_stdout(logw), contextlib.redirect_stderr(logw):
+                    if params["use_vad"]:
+                        plan = self._compute_plan_vad(mod, inp, params)
+                    else:
+                        plan = mod.compute_plan(inp, **params)
 
-                outw.flush()
-                errw.flush()
-
-                self._plan = plan
-                dur = float(plan["duration"])
-                kept_total = float(plan["kept_total"])
-                removed_total = float(plan["removed_total"])
-                segs = plan["keeps_count"]
-
-                self.after(0, lambda: self.preview_status.set(
-                    f"Duration {_sec_to_hhmmss(dur)} · Keep {_sec_to_hhmmss(kept_total)} · Cut {_sec_to_hhmmss(removed_total)} · Segments {segs}"
-                ))
-                self.after(0, self._draw_all_timelines)
+                logw.flush()
+                self.after(0, self._report_analyze_result, gen, plan)
 
             except Exception as e:
-                _err_msg = str(e)
                 try:
-                    outw.flush()
-                    errw.flush()
+                    logw.flush()
                 except:
                     pass
-                self.after(0, lambda: self.preview_status.set("(Analysis failed)"))
-                self.after(0, lambda: messagebox.showerror("Error", _err_msg))
+                self.after(0, self._report_analyze_failure, gen, str(e))
 
-        threading.Thread(target=worker, daemon=True).start()
+        self._submit_work(worker)
+
+    # Both run on the Tk thread, one callback per outcome
+    def _report_analyze_result(self, gen: int, plan: dict):
+        if gen != self._analysis_gen:
+            return
+        self._set_plan(plan)
+        self.preview_status.set(
+            f"Duration {_sec_to_hhmmss(float(plan['duration']))} · Keep {_sec_to_hhmmss(float(plan['kept_total']))} · "
+            f"Cut {_sec_to_hhmmss(float(plan['removed_total']))} · Segments {plan['keeps_count']}"
+        )
+        self._draw_all_timelines()
+
+    def _report_analyze_failure(self, gen: int, err_msg: str):
+        if gen != self._analysis_gen:
+            return
+        self.preview_status.set("(Analysis failed)")
+        messagebox.showerror("Error", err_msg)
+
+    def _submit_work(self, fn):
+        # Analyses and exports run in order on one long-lived worker thread instead of a new thread per
+        # click. A daemon thread rather than a ThreadPoolExecutor, whose threads are joined at exit and
+        # would hold the closed window's process until ffmpeg finished.
+        if self._work_q is None:
+            self._work_q = queue.Queue()
+            threading.Thread(target=self._work_loop, args=(self._work_q,), daemon=True).start()
+        self._work_q.put(fn)
+
+    @staticmethod
+    def _work_loop(q):
+        while True:
+            fn = q.get()
+            try:
+                fn()
+            except Exception:
+                # The jobs report their own errors; never let one take the worker down with it
+                pass
+
+    def _compute_plan_vad(self, mod, inp: str, params: dict):
+        # The VAD path runs a Python frame loop that holds the GIL for most of the analysis; give it its
+        # own process so the Tk loop stays responsive. The plain silencedetect path is ffmpeg-bound and
+        # stays on the worker thread. Falls back to in-process if the process can't be started or dies.
+        if not getattr(sys, "frozen", False):
+            conn = None
+            try:
+                if self._plan_proc is None or not self._plan_proc.is_alive():
+                    self._stop_plan_process()
+                    # Kept across analyses (the child caches the cutter); daemon, so multiprocessing
+                    # terminates it at exit too
+                    conn, child_conn = multiprocessing.Pipe()
+                    proc = multiprocessing.Process(target=_plan_child_main, args=(child_conn,), daemon=True)
+                    proc.start()
+                    child_conn.close()
+                    self._plan_proc, self._plan_conn = proc, conn
+                conn = self._plan_conn
+                conn.send((_script_path(), inp, params))
+            except (OSError, RuntimeError) as e:
+                conn = None
+                self._stop_plan_process()
+                print(f"[VAD] Analysis process unavailable ({e}); running in-process.")
+            if conn is not None:
+                try:
+                    ok, result = conn.recv()
+                except (EOFError, OSError) as e:
+                    self._stop_plan_process()
+                    print(f"[VAD] Analysis process died ({e!r}); running in-process.")
+                else:
+                    if not ok:
+                        raise result
+                    return result
+        return mod.compute_plan(inp, **params)
 
     # ---------------- Jump buttons ----------------
-    def _cuts(self) -> list[tuple[float, float]]:
-        if not self._plan:
-            return []
-        cuts = [(float(a), float(b)) for a, b in self._plan.get("removes", []) if float(b) > float(a)]
-        cuts.sort(key=lambda x: x[0])
-        return cuts
+    def _cut_edges(self):
+        # _set_plan keeps the cuts as start-sorted arrays, so the jumps can bisect instead of scanning
+        return self._plan_segs.get("removes", ((), ())) if self._plan else ((), ())
+
+    def _jump_to(self, nt: float):
+        self._playhead_sec = nt
+        self._safe_seek_player(nt)
+        if self._set_view_center_time(nt):
+            self._schedule_redraw()
+        else:
+            self._update_playhead_only()
 
     def jump_next_cut(self):
-        cuts = self._cuts()
-        if not cuts:
+        starts, ends = self._cut_edges()
+        if not starts:
             return
 
         eps = 0.001  # 1ms - prevents re-selecting the same boundary
-        t = float(self._playhead_sec)
-
-        for a, b in cuts:
-            # If we're inside a cut, jump to its end (plus eps)
-            if a <= t < b:
-                nt = min(self._timeline_duration(), b + eps)
-                self._playhead_sec = nt
-                self._safe_seek_player(nt)
-                self._set_view_center_time(nt)
-                self._draw_all_timelines()
-                return
+        t = self._playhead_sec
 
-            # Otherwise jump to the next cut start (plus eps)
-            if a > t + eps:
-                nt = min(self._timeline_duration(), a + eps)
-                self._playhead_sec = nt
-                self._safe_seek_player(nt)
-                self._set_view_center_time(nt)
-                self._draw_all_timelines()
-                return
+        # If we're inside a cut, jump to its end (plus eps)
+        i = bisect.bisect_right(starts, t)
+        if i > 0 and t < ends[i - 1]:
+            self._jump_to(min(self._timeline_duration(), ends[i - 1] + eps))
+            return
+
+        # Otherwise jump to the next cut start (plus eps), skipping empty cuts
+        i = bisect.bisect_right(starts, t + eps)
+        while i < len(starts) and ends[i] <= starts[i]:
+            i += 1
+        if i < len(starts):
+            self._jump_to(min(self._timeline_duration(), starts[i] + eps))
+            return
 
         # If we're past the last cut, go to end
         dur = self._timeline_duration()
         if dur > 0:
-            nt = max(0.0, dur - eps)
-            self._playhead_sec = nt
-            self._safe_seek_player(nt)
-            self._set_view_center_time(nt)
-            self._draw_all_timelines()
+            self._jump_to(max(0.0, dur - eps))
 
     def jump_prev_cut(self):
-        cuts = self._cuts()
-        if not cuts:
+        starts, ends = self._cut_edges()
+        if not starts:
             return
 
         eps = 0.001
-        t = float(self._playhead_sec)
+        t = self._playhead_sec
 
         # If inside a cut, jump to its start (minus eps)
-        for a, b in cuts:
-            if a <= t < b:
-                nt = max(0.0, a - eps)
-                self._playhead_sec = nt
-                self._safe_seek_player(nt)
-                self._set_view_center_time(nt)
-                self._draw_all_timelines()
-                return
+        i = bisect.bisect_right(starts, t)
+        if i > 0 and t < ends[i - 1]:
+            self._jump_to(max(0.0, starts[i - 1] - eps))
+            return
 
         # Otherwise jump to the previous cut start
-        prev_a = None
-        for a, _b in cuts:
-            if a < t - eps:
-                prev_a = a
-            else:
-                break
-
-        if prev_a is not None:
-            nt = max(0.0, prev_a - eps)
-            self._playhead_sec = nt
-            self._safe_seek_player(nt)
-            self._set_view_center_time(nt)
-            self._draw_all_timelines()
+        i = bisect.bisect_left(starts, t - eps) - 1
+        while i >= 0 and ends[i] <= starts[i]:
+            i -= 1
+        if i >= 0:
+            self._jump_to(max(0.0, starts[i] - eps))
             return
 
         # If we're before the first cut, go to 0
-        self._playhead_sec = 0.0
-        self._safe_seek_player(0.0)
-        self._set_view_center_time(0.0)
-        self._draw_all_timelines()
+        self._jump_to(0.0)
 
     # ---------------- Generate XML ----------------
     def run(self):
         if self._running:
             return
+        self._flush_settings_save()
 
         inp = self.input_path.get().strip()
         if not inp or not os.path.isfile(inp):
@@ -1064,19 +1678,20 @@ class App(tk.Tk):
         self._set_running(True)
 
         def worker():
-            outw = QueueWriter(self._log_q, "")
-            errw = QueueWriter(self._log_q, "")
+            # One writer for both streams keeps stdout/stderr lines from splicing into each other
+            logw = QueueWriter(self._log_q, notify=self._notify_log)
+            # (is_error, title, message) for the dialog, handed to the Tk thread in one callback at the end
+            outcome = None
 
             try:
                 mod = self._load_cutter()
                 if not hasattr(mod, "main"):
                     raise RuntimeError("cut_silence_to_fcpxml.py does not expose main(argv).")
 
-                with contextlib.redirect_stdout(outw), contextlib.redirect_stderr(errw):
+                with contextlib.redirect_stdout(logw), contextlib.redirect_stderr(logw):
                     rc = mod.main(argv)
 
-                outw.flush()
-                errw.flush()
+                logw.flush()
 
                 if rc is None:
                     rc = 0
@@ -1084,25 +1699,31 @@ class App(tk.Tk):
                 if rc == 0:
                     base = os.path.splitext(os.path.basename(inp))[0]
                     out_xml = os.path.join(os.path.dirname(os.path.abspath(inp)), f"{base}__nosilence.XML")
-                    self._log_q.put(f"\nDone.\nXML:\n{out_xml}\n")
-                    self.after(0, lambda: messagebox.showinfo("Done", f"Finished!\n\nXML:\n{out_xml}"))
+                    self._post_log(f"\nDone.\nXML:\n{out_xml}\n")
+                    outcome = (False, "Done", f"Finished!\n\nXML:\n{out_xml}")
                 else:
-                    self._log_q.put(f"\nFailed (exit code {rc}).\n")
-                    self.after(0, lambda: messagebox.showerror("Error", f"Failed (exit code {rc}). See log."))
+                    self._post_log(f"\nFailed (exit code {rc}).\n")
+                    outcome = (True, "Error", f"Failed (exit code {rc}). See log.")
 
             except Exception as e:
                 _err_msg = str(e)
                 try:
-                    outw.flush()
-                    errw.flush()
+                    logw.flush()
                 except:
                     pass
-                self._log_q.put(f"\nERROR: {_err_msg}\n")
-                self.after(0, lambda: messagebox.showerror("Error", _err_msg))
+                self._post_log(f"\nERROR: {_err_msg}\n")
+                outcome = (True, "Error", _err_msg)
             finally:
-                self.after(0, lambda: self._set_running(False))
+                self.after(0, self._report_run_result, outcome)
 
-        threading.Thread(target=worker, daemon=True).start()
+        self._submit_work(worker)
+
+    def _report_run_result(self, outcome):
+        # Re-enable the buttons before the dialog, which blocks in its own loop until dismissed
+        self._set_running(False)
+        if outcome is not None:
+            is_error, title, msg = outcome
+            (messagebox.showerror if is_error else messagebox.showinfo)(title, msg)
 
     # ---------------- VLC embedded playback ----------------
     def _init_vlc_if_available(self):
@@ -1114,26 +1735,67 @@ class App(tk.Tk):
             )
             return
 
+        # What the binding offers for metadata parsing is fixed per process; resolve it once here
+        parse = getattr(getattr(self._vlc, "Media", None), "parse_with_options", None)
+        self._vlc_parse_fn = parse if callable(parse) else None
+        # local = 1 in some builds; flags enum varies across VLC versions
+        flag = getattr(self._vlc, "MediaParseFlag", None)
+        self._vlc_parse_flag = getattr(flag, "local", 1) if flag else 1
+
+    def _ensure_vlc_player(self) -> bool:
+        # The libvlc instance (plugin scan, audio device probe) and the player are created on first use
+        # (loading a file, pressing play), so a session that never plays anything doesn't pay for them
+        global _VLC_INSTANCE
+        if self._vlc_player is not None:
+            return True
+        if self._vlc is None or self._vlc_init_failed:
+            return False
         try:
-            self._vlc_instance = self._vlc.Instance()
+            if _VLC_INSTANCE is None:
+                _VLC_INSTANCE = self._vlc.Instance()
+            self._vlc_instance = _VLC_INSTANCE
             self._vlc_player = self._vlc_instance.media_player_new()
             self.update_idletasks()
             self._vlc_player.set_hwnd(self.player_surface.winfo_id())
             self._apply_volume()
+            self._attach_vlc_events()
             self._start_vlc_poll()
         except Exception as e:
             self._append_log(f"[VLC] Failed to initialize embedded player: {e}\n\n")
             self._vlc_instance = None
             self._vlc_player = None
+            # Don't retry (and log again) on every file change
+            self._vlc_init_failed = True
+            return False
+        return True
+
+    def _attach_vlc_events(self):
+        # libvlc announces time, length and play-state changes itself; when these are attached the poll
+        # timer skips the full time/length refresh on ticks where none came in
+        try:
+            em = self._vlc_player.event_manager()
+            et = self._vlc.EventType
+            for name in ("MediaPlayerTimeChanged", "MediaPlayerLengthChanged", "MediaPlayerPlaying",
+                         "MediaPlayerPaused", "MediaPlayerStopped", "MediaPlayerEndReached"):
+                em.event_attach(getattr(et, name), self._on_vlc_event)
+            self._vlc_events_ok = True
+        except Exception as e:
+            self._append_log(f"[VLC] Player events unavailable ({e}); polling instead.\n")
+
+    def _on_vlc_event(self, event):
+        # Runs on a libvlc thread. It must not block: event_generate from here waits for the Tk thread,
+        # which may itself be inside stop()/set_media() waiting for this thread. Only raise a flag; the
+        # Tk-side timer (_vlc_poll) reads the player when it sees it.
+        self._vlc_event_pending = True
 
     def _vlc_load_media(self, path: str):
-        if not self._vlc_player or not self._vlc_instance:
+        if not self._ensure_vlc_player():
             return
 
         try:
             if self._vlc_loaded_path == path:
                 # Same file: do not nuke plan; just ensure timelines are drawn
-                self._draw_all_timelines()
+                self._schedule_redraw()
                 return
 
             self._vlc_player.stop()
@@ -1142,24 +1804,27 @@ class App(tk.Tk):
 
             self._vlc_loaded_path = path
             self._vlc_duration_sec = 0.0
+            self._vlc_time_live = False
 
             # IMPORTANT: don't clear plan when restoring session
             if not getattr(self, "_restoring_session", False):
-                self._plan = None
+                self._set_plan(None)
                 self.preview_status.set("(No analysis yet)")
                 self._playhead_sec = 0.0
 
-            # If you added the parse-duration async helper, call it here:
-            # self._vlc_parse_duration_async(media)
+            # Duration comes from the metadata parse, so nothing has to be played to learn it
+            self._vlc_media = media
+            self._vlc_parse_duration_async(media)
 
-            self._draw_all_timelines()
+            self._schedule_redraw()
+            self._start_vlc_poll()
             self._append_log(f"[VLC] Loaded: {path}\n")
 
         except Exception as e:
             self._append_log(f"[VLC] Load error: {e}\n")
 
     def player_toggle_play(self):
-        if not self._vlc_player:
+        if not self._ensure_vlc_player():
             return
 
         try:
@@ -1168,16 +1833,22 @@ class App(tk.Tk):
                 return
 
             if self._vlc_loaded_path and os.path.isfile(self._vlc_loaded_path):
-                self._vlc_player.play()
+                self._vlc_play()
                 return
 
             p = self.input_path.get().strip()
             if p and os.path.isfile(p):
                 self._vlc_load_media(p)
-                self.after(60, lambda: self._vlc_player.play())
+                self.after(60, self._vlc_play)
         except Exception as e:
             self._append_log(f"[VLC] Play/Pause error: {e}\n")
 
+    def _vlc_play(self):
+        self._vlc_player.play()
+        self._vlc_time_live = True
+        # is_playing() lags play() by a moment; switch the poll to the playback cadence right away
+        self._start_vlc_poll(playing=True)
+
     def player_stop(self):
         if not self._vlc_player:
             return
@@ -1192,8 +1863,10 @@ class App(tk.Tk):
         t = max(0.0, self._current_player_time_sec() + float(delta_sec))
         self._playhead_sec = t
         self._safe_seek_player(t)
-        self._set_view_center_time(t)
-        self._draw_all_timelines()
+        if self._set_view_center_time(t):
+            self._schedule_redraw()
+        else:
+            self._update_playhead_only()
 
     def _current_player_time_sec(self) -> float:
         if not self._vlc_player:
@@ -1207,7 +1880,12 @@ class App(tk.Tk):
             return 0.0
 
     def _safe_seek_player(self, t_sec: float):
-        if not self._vlc_player or self._safe_seek_inflight:
+        if not self._vlc_player:
+            return
+        if self._safe_seek_inflight:
+            # Held-down jump keys: keep only the latest target and send it once the seek in flight has
+            # settled, instead of dropping it (the playhead already shows it) or seeking per keypress
+            self._pending_seek_target = t_sec
             return
 
         self._safe_seek_inflight = True
@@ -1224,6 +1902,15 @@ class App(tk.Tk):
             pass
 
         def resume():
+            target = self._pending_seek_target
+            if target is not None:
+                self._pending_seek_target = None
+                try:
+                    self._vlc_player.set_time(int(max(0.0, target) * 1000.0))
+                except:
+                    pass
+                self.after(50, resume)
+                return
             try:
                 if was_playing:
                     self._vlc_player.play()
@@ -1244,48 +1931,102 @@ class App(tk.Tk):
 
     def on_volume_slider(self, v):
         try:
-            self.volume.set(int(float(v)))
+            vol = int(float(v))
         except:
             return
+        # ttk.Scale reports fractional positions, so most callbacks during a drag land on the same integer
+        if vol == self.volume.get():
+            return
+        self.volume.set(vol)
+        # A drag fires this per pixel; hand libvlc (and the OS mixer behind it) one value per 30ms
+        if self._volume_after_id is None:
+            self._volume_after_id = self.after(30, self._flush_volume)
+
+    def _flush_volume(self):
+        self._volume_after_id = None
         self._apply_volume()
 
-    def _start_vlc_poll(self):
+    def _start_vlc_poll(self, playing: bool | None = None):
         if self._vlc_poll_after_id is not None:
             self.after_cancel(self._vlc_poll_after_id)
-        self._vlc_poll_after_id = self.after(100, self._vlc_poll)
+            self._vlc_poll_after_id = None
+        # With nothing loaded there is nothing to follow: no timer at all, so an idle app doesn't wake up.
+        # Once a file is loaded the timer always runs, events or not: the libvlc event thread can't safely
+        # wake the Tk loop itself (see _on_vlc_event).
+        if not self._vlc_loaded_path:
+            return
+        # Follow the playhead closely during playback; a paused or stopped player only needs an
+        # occasional check (seeks and clicks move the playhead themselves).
+        if playing is None:
+            try:
+                playing = bool(self._vlc_player and self._vlc_player.is_playing())
+            except:
+                playing = False
+        self._vlc_poll_after_id = self.after(100 if playing else 500, self._vlc_poll)
+
+    def _set_time_label(self, cur: float, dur: float):
+        # Updated many times a second during playback. The label shows whole milliseconds and the total
+        # rarely changes, so only format and write the Tcl variable (and relayout the label) when the
+        # shown value moves; while paused that's never.
+        key = (int(cur * 1000.0), dur)
+        if key == self._time_label_key:
+            return
+        self._time_label_key = key
+        if dur != self._time_dur_key:
+            self._time_dur_key, self._time_dur_text = dur, _sec_to_hhmmss(dur) if dur > 0 else "0:00.000"
+        self.time_label.set(f"{_sec_to_hhmmss(cur)} / {self._time_dur_text}")
 
     def _vlc_poll(self):
         self._vlc_poll_after_id = None
         if not self._vlc_player:
             return
+        if not self._vlc_events_ok:
+            self._vlc_refresh()
+        elif self._vlc_event_pending:
+            # Events attached: only refresh time and length when one has come in since the last tick
+            # (the reschedule below still asks libvlc whether it's playing)
+            self._vlc_event_pending = False
+            self._vlc_refresh()
+        self._start_vlc_poll()
 
+    def _vlc_refresh(self):
+        # Pull length and time from the player into the label and playhead (from the poll or a player event)
         try:
+            tl_dur = self._timeline_duration()
             len_ms = self._vlc_player.get_length()
+            if not len_ms and self._vlc_media is not None:
+                # Not played yet: the player has no length, but the parsed media may
+                len_ms = self._vlc_media.get_duration()
             if len_ms and len_ms > 0:
                 self._vlc_duration_sec = float(len_ms) / 1000.0
 
-            cur = self._current_player_time_sec()
+            # Until this media has been played the player's time is just 0; keep the playhead where the
+            # session or the user put it (the parsed duration arriving mustn't reset it)
+            cur = self._current_player_time_sec() if self._vlc_time_live else self._playhead_sec
             dur = float(self._vlc_duration_sec)
 
+            self._set_time_label(cur, dur)
             if dur > 0:
-                self.time_label.set(f"{_sec_to_hhmmss(cur)} / {_sec_to_hhmmss(dur)}")
                 self._playhead_sec = cur
-                self._draw_all_timelines()
-            else:
-                self.time_label.set(f"{_sec_to_hhmmss(cur)} / 0:00.000")
+                # The timeline only needs laying out again when VLC just changed its length
+                if self._timeline_duration() != tl_dur:
+                    self._schedule_redraw()
+                else:
+                    self._update_playhead_only()
 
         except:
             pass
 
-        self._start_vlc_poll()
-
 
 if __name__ == "__main__":
-    try:
-        import ctypes
+    # The built SilenceCut.exe only launches pythonw on this script, so a manifest on the exe would
+    # not reach this process; DPI awareness has to be set here, before the first window exists.
+    if os.name == "nt":
+        try:
+            import ctypes
 
-        ctypes.windll.shcore.SetProcessDpiAwareness(2)
-    except:
-        pass
+            ctypes.windll.shcore.SetProcessDpiAwareness(2)
+        except:
+            pass
 
     App().mainloop()